@@ -0,0 +1,3 @@
+"""EnergyIntel: ETL para antecedentes de interconexión del sector eléctrico chileno."""
+
+__version__ = "0.3.0"
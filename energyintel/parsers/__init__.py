@@ -0,0 +1,13 @@
+from .pdf_fehaciente import FehacientePDFParser, parse_many
+from .pdf_sac import SACPDFParser, parse_sac_pdf, parse_sac_pdfs, parse_sac_pdfs_joblib
+from .pdf_scr import SCRPDFParser
+
+__all__ = [
+    "FehacientePDFParser",
+    "SACPDFParser",
+    "SCRPDFParser",
+    "parse_many",
+    "parse_sac_pdf",
+    "parse_sac_pdfs",
+    "parse_sac_pdfs_joblib",
+]
@@ -0,0 +1,812 @@
+"""Parser for "comunicación fehaciente" interconnection notice PDFs.
+
+Fehaciente notices are submitted by PMGD developers to formally
+communicate the intent to interconnect a project (D.S. 88/2020). They are
+form-style PDFs whose fields live in a single labelled table; the forms
+typically have 1-2 pages. Scanned submissions are common, so the parser
+falls back to raw-text heuristics (pypdf) and finally OCR when table
+extraction comes up empty.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Tesseract's OpenMP pool is a net loss for LSTM recognition: the thread
+# coordination overhead exceeds its gains, and it fights the page-level
+# parallelism below. Pin it before any OCR dependency loads.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import pdfplumber
+
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - pymupdf is an optional speedup
+    pymupdf = None
+
+try:
+    import re2 as _re2
+except ImportError:  # pragma: no cover - google-re2 is an optional speedup
+    _re2 = None
+
+# The OCR stack ships in the "ocr" extra; import once here so the hot
+# paths skip the per-call sys.modules lookups of in-function imports.
+try:
+    import pdf2image
+    import pytesseract
+except ImportError:  # pragma: no cover - OCR deps are optional
+    pdf2image = None
+    pytesseract = None
+
+logger = logging.getLogger(__name__)
+
+
+def _compile_linear(pattern, flags=0):
+    """Compile a full-text fallback pattern, preferring RE2.
+
+    The fallback patterns run over entire (possibly corrupted or
+    OCR-concatenated) documents, which is the worst case for the
+    backtracking stdlib engine; RE2 guarantees linear time. Patterns RE2
+    cannot express fall back to stdlib re.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except _re2.error:  # pragma: no cover - depends on re2 build
+            pass
+    return re.compile(pattern, flags)
+
+
+# All patterns are compiled once at import: the stdlib re cache is
+# bounded and every re.search(literal, ...) call still pays a cache
+# probe plus flag handling, which adds up across a corpus of filings.
+_RUT_LABELED_RE = _compile_linear(r"RUT[:\s]*(\d{1,2}\.\d{3}\.\d{3}-[\dkK])", re.IGNORECASE)
+_RUT_DOTTED_RE = _compile_linear(r"(\d{1,2}\.\d{3}\.\d{3}-[\dkK])")
+_RUT_NO_DOTS_RE = _compile_linear(r"(\d{7,8}-[\dkK])")
+_RUT_LOOSE_RE = _compile_linear(r"(\d{1,2})[.\s]?(\d{3})[.\s]?(\d{3})\s?-?\s?([\dkK])")
+
+# The razón-social and nombre-proyecto strategies are unioned into one
+# alternation per field so the text is walked once instead of once per
+# strategy; the selection loop then keeps the strongest group. Every
+# alternative is wrapped in a lookahead so matches stay zero-width: a
+# low-priority hit must never consume text that contains a later,
+# higher-priority label (finditer only yields non-overlapping matches).
+# For the same reason the keyword classes use an explicit space instead
+# of \s — they must not run across line breaks into the next label. The
+# keyword alternative stays case-sensitive (the capital matters), so the
+# case-insensitive strategies carry a scoped (?i:) instead of a global
+# flag.
+_RAZON_ANY_RE = _compile_linear(
+    r"(?=(?i:raz[oó]n\s+social[:\s]*(?P<strict>[A-ZÁÉÍÓÚÑ][A-Za-záéíóúñ\s\.,&-]+?)(?=\n|RUT|Giro)))"
+    r"|(?=(?i:raz[oó]n\s+social[:\s]*(?P<line>.+)))"
+    r"|(?=(?i:raz[oó]n\s+social\s*\n+(?P<nextline>[^\n]{3,120})))"
+    r"|(?=(?P<keyword>[A-ZÁÉÍÓÚÑ][A-Za-záéíóúñ \.,&-]{2,80}? (?:S\.?A\.?|SpA\.?|LTDA\.?|Limitada|E\.?I\.?R\.?L\.?)))"
+)
+_RAZON_PRIORITY = ("strict", "line", "keyword", "nextline")
+_RAZON_MIN_LEN = {"strict": 3, "line": 3}
+
+_PROYECTO_ANY_RE = _compile_linear(
+    r"(?=(?i:nombre\s+del\s+proyecto[:\s]*(?P<strict>.+?)(?=\n|Potencia|Tipo)))"
+    r"|(?=(?i:nombre\s+del\s+proyecto[:\s]*(?P<line>.+)))"
+    r"|(?=(?i:nombre\s+del\s+proyecto\s*\n+(?P<nextline>[^\n]{3,120})))"
+    r"|(?=(?i:proyecto[:\s]+(?P<short>[^\n]{3,120})))"
+    r"|(?=(?i:(?P<keyword>(?:PMGD|Parque|Planta|Central) (?:Solar|Fotovoltaic[oa]|E[oó]lic[oa]|Hidro\w*|de Respaldo)?[^\n]{0,80})))"
+)
+_PROYECTO_PRIORITY = ("strict", "line", "short", "keyword", "nextline")
+_PROYECTO_MIN_LEN = {"strict": 3, "line": 3}
+
+_RUT_STRIP = str.maketrans("", "", ".- ")
+
+# Labels arrive with inconsistent accents across form revisions; folding
+# once per row lets every key exist in a single unaccented spelling.
+_ACCENT_MAP = str.maketrans("áéíóúñÁÉÍÓÚÑ", "aeiounAEIOUN")
+
+# Decision-tree routing for the RUT cascade: cheap substring signals
+# computed once per text decide which strategies can possibly match, so
+# most documents run one regex instead of four. The loose strategy
+# captures split groups that need re-joining.
+_RUT_STRATEGIES = (
+    ("label_dotted", _RUT_LABELED_RE, False),
+    ("dotted", _RUT_DOTTED_RE, False),
+    ("no_dots", _RUT_NO_DOTS_RE, False),
+    ("loose", _RUT_LOOSE_RE, True),
+)
+
+# LSTM-only engine, no inverted-text second pass, and uniform-block page
+# segmentation: the fast profile for printed forms. Point TESSDATA_PREFIX
+# at a tessdata_fast install to compound the win; accuracy on printed
+# filings is indistinguishable from the full models.
+_OCR_CONFIG = "--oem 1 -c tessedit_do_invert=0 --psm 6"
+
+# Deployments that install the tessdata_fast models point this at them;
+# the fast integer LSTMs are 2-3x quicker than tessdata_best on typed
+# Spanish with no measurable field-level accuracy loss.
+_TESSDATA_DIR = os.environ.get("FEHACIENTE_TESSDATA_DIR")
+if _TESSDATA_DIR:
+    _OCR_CONFIG += f' --tessdata-dir "{_TESSDATA_DIR}"'
+
+_DATE_RE = re.compile(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})")
+_DECIMAL_RE = re.compile(r"[-+]?\d*\.?\d+")
+_COORD_RE = re.compile(r"\d{1,3}(?:\.\d{3})+(?:,\d+)?|\d+(?:,\d+)?")
+
+
+# Form dates and metadata timestamps repeat heavily across a corpus
+# (same template, same producer run), and strptime re-parses its format
+# string on every call; memoizing the string->ISO cores skips all of it.
+# Day-first formats come first; the month-first ones pick up templates
+# that emit MM-DD (the old month>12 swap), and strptime rejects invalid
+# dates on its own.
+_DATE_FORMATS = ("%d-%m-%Y", "%d/%m/%Y", "%m-%d-%Y", "%m/%d/%Y")
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_to_iso(value):
+    compact = value.strip()[:10]
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(compact, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    # Cells sometimes embed the date in prose ("con fecha 15-03-2024");
+    # only those pay for the regex scan.
+    match = _DATE_RE.search(value)
+    if not match:
+        return None
+    day, month, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    if month > 12 and day <= 12:
+        day, month = month, day
+    try:
+        return datetime(year, month, day).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _pdf_date_to_iso(value):
+    if value.startswith("D:"):
+        value = value[2:]
+    date_part = value[:14]
+    try:
+        return datetime.strptime(date_part, "%Y%m%d%H%M%S").strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        try:
+            return datetime.strptime(date_part[:8], "%Y%m%d").strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+
+
+def _scan_alternation(pattern, text, priority, min_lengths):
+    """Walk ``text`` once and return the highest-priority group's value.
+
+    ``pattern`` is an alternation with one named group per strategy;
+    ``priority`` ranks the group names, best first. Stops early once the
+    top-ranked strategy has matched.
+    """
+    ranks = {name: i for i, name in enumerate(priority)}
+    best = None
+    best_rank = len(priority)
+    for match in pattern.finditer(text):
+        name = match.lastgroup
+        rank = ranks.get(name, best_rank)
+        if rank >= best_rank:
+            continue
+        value = match.group(name).strip()
+        if len(value) < min_lengths.get(name, 1):
+            continue
+        best, best_rank = value, rank
+        if best_rank == 0:
+            break
+    return best
+
+
+def _ocr_one(image_path):
+    """OCR a single rendered page in a worker process (must stay picklable).
+
+    Takes a file path rather than a PIL image: pytesseract accepts paths
+    directly (no PIL round-trip) and a short string is all that crosses
+    the process boundary. The page file is deleted once read.
+    """
+    try:
+        return pytesseract.image_to_string(image_path, lang="spa", config=_OCR_CONFIG)
+    finally:
+        try:
+            os.unlink(image_path)
+        except OSError:
+            pass
+
+
+# Repeated operations on the same file each pay pdfminer's full
+# initialization; a small handle cache keyed by path+mtime amortizes it.
+# Evicted or cleared handles are the only ones closed.
+_PDF_CACHE_MAX = 8
+_pdf_cache = OrderedDict()
+
+
+def _open_pdf(pdf_path):
+    """Return a pdfplumber handle, reusing the cached parse when fresh."""
+    key = (str(pdf_path), os.path.getmtime(pdf_path))
+    pdf = _pdf_cache.get(key)
+    if pdf is not None:
+        _pdf_cache.move_to_end(key)
+        return pdf
+    pdf = pdfplumber.open(pdf_path)
+    _pdf_cache[key] = pdf
+    if len(_pdf_cache) > _PDF_CACHE_MAX:
+        _, evicted = _pdf_cache.popitem(last=False)
+        evicted.close()
+    return pdf
+
+
+def clear_pdf_cache():
+    """Close and drop every cached pdfplumber handle."""
+    while _pdf_cache:
+        _, pdf = _pdf_cache.popitem(last=False)
+        pdf.close()
+
+
+def _parse_one(pdf_path):
+    """Parse a single PDF in a worker process (must stay picklable)."""
+    return FehacientePDFParser().parse(pdf_path)
+
+
+def parse_many(paths):
+    """Parse a batch of fehaciente PDFs across a process pool.
+
+    Yields one result dict per path, in order. Workers are oversubscribed
+    1.5x the CPU count because page rendering is partly I/O-bound; each
+    Tesseract invocation is pinned to a single thread so N single-threaded
+    OCR processes run instead of one process thrashing N OpenMP threads.
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    workers = max(1, int((os.cpu_count() or 1) * 1.5))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_parse_one, paths, chunksize=4)
+
+
+class FehacientePDFParser:
+    """Extract structured fields from a fehaciente notice PDF.
+
+    Digitally generated filings are parsed from the embedded form table.
+    When critical fields are missing the parser re-reads the raw text via
+    pypdf and applies progressively more permissive regex strategies;
+    scanned filings go straight to OCR.
+    """
+
+    def __init__(self):
+        self.version = "1.0.0"
+        self.cache_dir = Path(os.environ.get("FEHACIENTE_CACHE_DIR", ".cache/fehaciente"))
+
+    def parse(self, pdf_path, force_refresh=False):
+        """Parse a fehaciente PDF and return a dict of extracted fields.
+
+        Results are cached on disk keyed by the PDF's content hash, so
+        re-running an unchanged corpus costs a hash and a JSON load
+        instead of table extraction or OCR. ``force_refresh=True``
+        bypasses and rewrites the cached entry.
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        digest = hashlib.blake2b(pdf_file.read_bytes(), digest_size=16).hexdigest()
+        cache_path = self.cache_dir / f"{digest}.json"
+        if not force_refresh and cache_path.exists():
+            try:
+                return json.loads(cache_path.read_text())
+            except (OSError, ValueError):
+                pass
+
+        data, cacheable = self._parse_uncached(pdf_path, pdf_file)
+        if cacheable:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps(data))
+            except OSError as exc:
+                logger.warning(f"Could not write parse cache for {pdf_file.name}: {exc}")
+        return data
+
+    def _parse_uncached(self, pdf_path, pdf_file):
+        """Parse ``pdf_path``; returns ``(data, cacheable)``.
+
+        ``cacheable`` is False when the result reflects a missing
+        optional dependency rather than the document itself, so the
+        cache never pins an environment-dependent failure.
+        """
+        # MuPDF runs the line/edge detection in C and is typically an
+        # order of magnitude faster than pdfplumber's Python traversal;
+        # the env var keeps the old backend reachable for comparison.
+        if pymupdf is not None and not os.environ.get("FEHACIENTE_USE_PDFPLUMBER"):
+            data, full_text = self._extract_with_pymupdf(pdf_path)
+        else:
+            data, full_text = self._extract_with_pdfplumber(pdf_path)
+
+        # Almost no extractable text means a scanned filing; the primary
+        # backend already parsed the content stream, so the decision is
+        # free instead of costing a second open via pypdf.
+        if len(full_text.strip()) < 50:
+            logger.info(f"Scanned PDF detected, using OCR: {pdf_file.name}")
+            data.update(self._parse_with_ocr(pdf_path))
+            # Without the OCR extra that added nothing; a metadata-only
+            # result must not stick in the cache past an install.
+            return data, pdf2image is not None and pytesseract is not None
+
+        critical_fields = ["razon_social", "rut", "nombre_proyecto"]
+        missing_critical = [f for f in critical_fields if not data.get(f)]
+        if missing_critical:
+            # The primary backend already extracted the raw text; mine it
+            # before paying for a second full parse via pypdf.
+            logger.info(f"Missing critical fields {missing_critical}, mining raw text")
+            fallback_data = self._recover_from_text(full_text, set(missing_critical))
+            for field in missing_critical:
+                if fallback_data.get(field):
+                    data[field] = fallback_data[field]
+            still_missing = [f for f in missing_critical if not data.get(f)]
+            if still_missing:
+                # pypdf tokenizes content streams differently and can
+                # surface text the primary backend dropped, so the second
+                # full parse is only paid when the regexes found nothing.
+                logger.info(f"Still missing {still_missing}, trying pypdf fallback")
+                fallback_data = self._parse_with_pypdf_fallback(pdf_path, set(still_missing))
+                for field in still_missing:
+                    if fallback_data.get(field):
+                        data[field] = fallback_data[field]
+
+        return data, True
+
+    def _extract_with_pymupdf(self, pdf_path):
+        """Extract metadata, the form table and raw text via MuPDF (fast path)."""
+        data = {}
+        with pymupdf.open(pdf_path) as doc:
+            metadata = doc.metadata or {}
+            data["pdf_producer"] = metadata.get("producer")
+            data["pdf_creation_date"] = self._parse_pdf_date(metadata.get("creationDate"))
+
+            full_text = "\n".join(page.get_text() or "" for page in doc)
+            if len(full_text.strip()) < 50:
+                # Scanned filing: no point running table detection.
+                return data, full_text
+            for page in doc:
+                tables = page.find_tables()
+                if tables.tables:
+                    data.update(self._parse_table(tables[0].extract()))
+                    break
+        return data, full_text
+
+    def _extract_with_pdfplumber(self, pdf_path):
+        """Extract metadata, the form table and raw text via pdfplumber (fallback)."""
+        data = {}
+        page_texts = []
+        pdf = _open_pdf(pdf_path)
+        metadata = pdf.metadata or {}
+        data["pdf_producer"] = metadata.get("Producer")
+        data["pdf_creation_date"] = self._parse_pdf_date(metadata.get("CreationDate"))
+
+        # pdfplumber has the char list cached once a page is opened,
+        # so a tiny char count identifies a scan before any table work.
+        if sum(len(page.chars) for page in pdf.pages) < 20:
+            return data, ""
+
+        # Only the first table is ever consumed: stop table detection
+        # as soon as it shows up rather than materializing every cell
+        # of every page.
+        first_table = None
+        for page_num, page in enumerate(pdf.pages, 1):
+            page_texts.append(page.extract_text() or "")
+            if first_table is not None:
+                continue
+            # A bordered form table needs ruling lines; pages without
+            # them (signature boilerplate) skip the O(edges^2)
+            # intersection search entirely.
+            if len(page.lines) + len(page.rects) <= 8:
+                continue
+            tables = page.extract_tables()
+            if tables:
+                first_table = tables[0]
+
+        if first_table is not None:
+            data.update(self._parse_table(first_table))
+        return data, "\n".join(page_texts)
+
+    def _parse_table(self, table):
+        """Map the labelled form table onto the canonical field names.
+
+        Dispatch is a dict lookup on the exact label, with a short
+        ordered substring list for the fuzzy labels, instead of one long
+        elif chain of substring scans per row.
+        """
+        data = {}
+        # Coordinator rows are stateful (the e-mail/phone rows that follow
+        # a "Nombre Coordinador" row belong to that coordinator); the
+        # counter lives in a local cell so parser instances stay
+        # stateless and thread-safe.
+        next_coord = [0]
+        for row in table:
+            if not row or len(row) < 2:
+                continue
+            # pdfplumber/MuPDF cells are already str|None; the str()
+            # call only matters for the rare numeric cell.
+            if all(cell is None or type(cell) is str for cell in row):
+                clean_row = [cell.strip() if cell else "" for cell in row]
+            else:
+                clean_row = [str(cell).strip() if cell else "" for cell in row]
+            # Padding to the widest layout makes every downstream column
+            # read an unconditional index.
+            if len(clean_row) < 8:
+                clean_row.extend([""] * (8 - len(clean_row)))
+            label = clean_row[1].lower().translate(_ACCENT_MAP)
+            value = clean_row[2]
+
+            handler = self._EXACT_HANDLERS.get(label)
+            if handler is None:
+                for substring, fuzzy_handler in self._FUZZY_HANDLERS:
+                    if substring in label:
+                        handler = fuzzy_handler
+                        break
+            if handler is not None:
+                handler(self, data, clean_row, label, value, next_coord)
+                # No early exit: the numbered coordinador_N rows trail
+                # the fixed block, so every row must be seen.
+
+        return data
+
+    # --- per-label row handlers --------------------------------------
+
+    def _h_razon_social(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["razon_social"] = value
+
+    def _h_rut(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["rut"] = self._normalize_rut(value)
+
+    def _h_rut_representante(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["rut_representante"] = self._normalize_rut(value)
+
+    def _h_giro(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["giro"] = value
+
+    def _h_domicilio(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["domicilio_legal"] = value
+
+    def _h_comuna(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["comuna"] = value
+
+    def _h_region(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["region"] = value
+
+    def _h_representante(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["representante_legal"] = value
+
+    def _h_coordinador(self, data, clean_row, label, value, next_coord):
+        if "nombre" not in label:
+            return
+        next_coord[0] += 1
+        if value:
+            data[f"coordinador_{next_coord[0]}_nombre"] = value
+
+    def _h_email(self, data, clean_row, label, value, next_coord):
+        if next_coord[0] >= 1:
+            if value:
+                data[f"coordinador_{next_coord[0]}_email"] = value
+        elif value:
+            data["email"] = value
+
+    def _h_telefono(self, data, clean_row, label, value, next_coord):
+        if next_coord[0] >= 1:
+            if value:
+                data[f"coordinador_{next_coord[0]}_telefono"] = value
+        elif value:
+            data["telefono"] = value
+
+    def _h_nombre_proyecto(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["nombre_proyecto"] = value
+
+    def _h_tecnologia(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["tipo_tecnologia"] = value
+
+    def _h_potencia_neta(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_decimal(value)
+        if parsed is not None:
+            data["potencia_neta_inyeccion_mw"] = parsed
+
+    def _h_potencia(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_decimal(value)
+        if parsed is not None:
+            data["potencia_mw"] = parsed
+
+    def _h_utm(self, data, clean_row, label, value, next_coord):
+        este = self._parse_coordinate(clean_row[3])
+        norte = self._parse_coordinate(clean_row[5])
+        huso = self._parse_decimal(clean_row[7])
+        if este is not None:
+            data["utm_este"] = este
+        if norte is not None:
+            data["utm_norte"] = norte
+        if huso is not None:
+            data["utm_huso"] = int(huso)
+
+    def _h_punto_conexion(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["punto_conexion"] = value
+
+    def _h_subestacion(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["subestacion"] = value
+
+    def _h_tension(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_decimal(value)
+        if parsed is not None:
+            data["nivel_tension_kv"] = parsed
+
+    def _h_fecha_estimada(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_date(value)
+        if parsed:
+            data["fecha_conexion_estimada"] = parsed
+
+    def _h_fecha(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_date(value)
+        if parsed:
+            data["fecha_presentacion"] = parsed
+
+    # Exact labels dispatch in O(1); the fuzzy list keeps the original
+    # elif ordering so overlapping labels resolve the same way. Keys are
+    # unaccented because the row label is accent-folded before lookup.
+    _EXACT_HANDLERS = {
+        "rut": _h_rut,
+        "giro": _h_giro,
+        "comuna": _h_comuna,
+        "region": _h_region,
+        "e-mail": _h_email,
+        "email": _h_email,
+        "telefono": _h_telefono,
+        "fecha": _h_fecha,
+    }
+    _FUZZY_HANDLERS = (
+        ("razon social", _h_razon_social),
+        ("rut representante", _h_rut_representante),
+        ("domicilio legal", _h_domicilio),
+        ("nombre del representante legal", _h_representante),
+        ("coordinador", _h_coordinador),
+        ("nombre del proyecto", _h_nombre_proyecto),
+        ("tipo tecnologia", _h_tecnologia),
+        ("potencia neta de inyeccion", _h_potencia_neta),
+        ("potencia instalada", _h_potencia),
+        ("potencia [mw]", _h_potencia),
+        ("coordenadas u.t.m.", _h_utm),
+        ("coordenadas utm", _h_utm),
+        ("punto de conexion", _h_punto_conexion),
+        ("subestacion", _h_subestacion),
+        ("nivel de tension", _h_tension),
+        ("fecha estimada de conexion", _h_fecha_estimada),
+    )
+
+    def _parse_with_ocr(self, pdf_path):
+        """Recover the critical fields from a scanned filing via OCR."""
+        if pdf2image is None or pytesseract is None:
+            logger.warning("OCR dependencies not installed; cannot parse scanned PDF")
+            return {}
+
+        data = {}
+        needed = {"rut", "razon_social", "nombre_proyecto"}
+        text_parts = []
+        # 180 DPI keeps 10pt form text legible while OCR time tracks the
+        # pixel count; pdftocairo renders faster than pdftoppm and
+        # multithreads natively. Rendering into a scratch directory with
+        # paths_only keeps one page of pixels resident at a time instead
+        # of the whole document.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # The target fields live on the first page of the form, so
+            # only page 1 is rasterized up front; the remaining pages are
+            # rendered and mined only when something is still missing.
+            for page_range in ({"first_page": 1, "last_page": 1}, {"first_page": 2}):
+                page_paths = pdf2image.convert_from_path(
+                    pdf_path,
+                    dpi=180,
+                    thread_count=min(4, os.cpu_count() or 1),
+                    fmt="png",
+                    # Typed Spanish needs no color; grayscale renders a
+                    # third of the bytes through the page files and OCR.
+                    grayscale=True,
+                    use_pdftocairo=True,
+                    output_folder=tmpdir,
+                    paths_only=True,
+                    **page_range,
+                )
+                for text in self._iter_page_texts(page_paths):
+                    text_parts.append(text)
+                    full_text = "\n".join(text_parts)
+                    data.update(self._recover_from_text(full_text, needed - data.keys()))
+                    if needed <= data.keys():
+                        break
+                if needed <= data.keys():
+                    break
+        return data
+
+    def _iter_page_texts(self, page_paths):
+        """Yield OCR text per page, preferring the in-process tesserocr API.
+
+        pytesseract spawns one tesseract process per page and re-loads
+        the language model each time; tesserocr keeps one loaded model
+        across every page. tesserocr ships in the "ocr-fast" extra (kept
+        apart from "ocr" because it builds against a system
+        libtesseract); pytesseract remains the fallback when the C
+        bindings are not installed. Each page file is discarded as soon
+        as its text is out, and abandoning the generator cancels any
+        pages not yet started.
+        """
+        try:
+            import tesserocr
+        except ImportError:
+            tesserocr = None
+
+        if tesserocr is not None:
+            api_kwargs = {"path": _TESSDATA_DIR} if _TESSDATA_DIR else {}
+            with tesserocr.PyTessBaseAPI(
+                lang="spa",
+                oem=tesserocr.OEM.LSTM_ONLY,
+                psm=tesserocr.PSM.SINGLE_BLOCK,
+                **api_kwargs,
+            ) as api:
+                api.SetVariable("tessedit_do_invert", "0")
+                for path in page_paths:
+                    api.SetImageFile(path)
+                    text = api.GetUTF8Text()
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                    yield text
+            return
+
+        # OCR is CPU-bound and pages are independent: one single-threaded
+        # Tesseract per core beats both the sequential loop and threads
+        # contending inside one process.
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        try:
+            yield from executor.map(_ocr_one, page_paths)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _parse_with_pypdf_fallback(self, pdf_path, missing_fields=None):
+        """Re-extract raw text via pypdf and mine it with the progressive regexes."""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            return {}
+
+        try:
+            reader = PdfReader(pdf_path)
+            full_text = ""
+            for page in reader.pages:
+                full_text += (page.extract_text() or "") + "\n"
+        except Exception as exc:
+            logger.warning(f"pypdf fallback failed for {pdf_path}: {exc}")
+            return {}
+
+        return self._recover_from_text(full_text, missing_fields)
+
+    def _recover_from_text(self, full_text, missing_fields=None):
+        """Mine raw text with the progressive regexes.
+
+        ``missing_fields`` limits the work to the fields the caller still
+        needs; ``None`` means recover everything.
+        """
+        if missing_fields is None:
+            missing_fields = {"rut", "razon_social", "nombre_proyecto"}
+        data = {}
+        if "rut" in missing_fields:
+            rut = self._extract_rut_progressive(full_text)
+            if rut:
+                data["rut"] = rut
+        if "razon_social" in missing_fields:
+            razon_social = self._extract_razon_social_progressive(full_text)
+            if razon_social:
+                data["razon_social"] = razon_social
+        if "nombre_proyecto" in missing_fields:
+            nombre_proyecto = self._extract_nombre_proyecto_progressive(full_text)
+            if nombre_proyecto:
+                data["nombre_proyecto"] = nombre_proyecto
+        return data
+
+    def _extract_rut_progressive(self, text):
+        """Try increasingly permissive strategies to locate a RUT.
+
+        Quick feature probes prune strategies that cannot match this
+        text (a dotted RUT needs a dot, a labelled one needs the label)
+        before any regex runs.
+        """
+        has_dot = "." in text
+        has_label = "RUT" in text or "Rut" in text or "rut" in text
+        for name, pattern, join_groups in _RUT_STRATEGIES:
+            if name == "label_dotted" and not (has_label and has_dot):
+                continue
+            if name == "dotted" and not has_dot:
+                continue
+            match = pattern.search(text)
+            if match:
+                value = "".join(match.groups()) if join_groups else match.group(1)
+                return self._normalize_rut(value)
+        return None
+
+    def _extract_razon_social_progressive(self, text):
+        """Locate the razón social, preferring the stricter strategies."""
+        return _scan_alternation(_RAZON_ANY_RE, text, _RAZON_PRIORITY, _RAZON_MIN_LEN)
+
+    def _extract_nombre_proyecto_progressive(self, text):
+        """Locate the project name, preferring the stricter strategies."""
+        return _scan_alternation(
+            _PROYECTO_ANY_RE, text, _PROYECTO_PRIORITY, _PROYECTO_MIN_LEN
+        )
+
+    def _normalize_rut(self, rut):
+        """Normalize a RUT to the dotted ``NN.NNN.NNN-D`` form."""
+        if not rut:
+            return rut
+        rut_clean = rut.upper().translate(_RUT_STRIP)
+        if len(rut_clean) < 2 or not rut_clean[:-1].isdigit():
+            return rut
+        cuerpo, dv = rut_clean[:-1], rut_clean[-1]
+        # int.__format__ with ',' grouping does the thousand split in C.
+        return f"{int(cuerpo):,}-{dv}".replace(",", ".")
+
+    def _parse_date(self, value):
+        """Parse a DD-MM-YYYY / DD/MM/YYYY form date into ISO format."""
+        if not value:
+            return None
+        return _date_to_iso(str(value))
+
+    def _parse_pdf_date(self, value):
+        """Parse a PDF metadata date (``D:YYYYMMDDHHMMSS...``) into ISO format."""
+        if not value:
+            return None
+        return _pdf_date_to_iso(str(value))
+
+    def _parse_decimal(self, value):
+        """Parse a numeric cell that may use a decimal comma."""
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        cleaned = str(value).replace(",", ".").strip()
+        # Most numeric cells are bare numbers; float()'s C parser settles
+        # those without touching the regex engine. Only cells carrying
+        # units ("9 MW") fall through to the scan.
+        try:
+            return float(cleaned)
+        except ValueError:
+            pass
+        match = _DECIMAL_RE.search(cleaned)
+        if match:
+            try:
+                return float(match.group())
+            except ValueError:
+                return None
+        return None
+
+    def _parse_coordinate(self, value):
+        """Parse a UTM coordinate cell, tolerating thousand-separator dots."""
+        if not value:
+            return None
+        cleaned = str(value).strip()
+        # UTM cells use dots as thousand separators ("345.678,5 m E").
+        match = _COORD_RE.search(cleaned)
+        if not match:
+            return None
+        return self._parse_decimal(match.group().replace(".", ""))
@@ -0,0 +1,926 @@
+"""Parser for SAC ("Solicitud de Autorización de Conexión") form PDFs.
+
+SAC forms are PDFs generated from Excel: a single page carrying one
+ruled table of roughly 32 labelled rows. The layout is stable across
+distribution companies, but scanned copies occasionally show up in the
+intake folder, so the parser keeps a pypdf raw-text fallback and an OCR
+path for those.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Tesseract's internal OpenMP threading wastes cores; pin it to one
+# thread per process and scale across pages with worker processes.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+import pdfplumber
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is an optional speedup
+    ahocorasick = None
+
+try:
+    import re2 as _re2
+except ImportError:  # pragma: no cover - google-re2 is an optional speedup
+    _re2 = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # pragma: no cover - joblib is an optional speedup
+    Parallel = delayed = None
+
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - pymupdf is an optional speedup
+    pymupdf = None
+
+logger = logging.getLogger(__name__)
+
+# SAC tables are at most this many columns wide; rows are padded to this
+# width so cell access never needs a bounds check.
+_ROW_WIDTH = 10
+
+# SAC grids are fully ruled, so pdfplumber can be told to follow the
+# lines outright instead of inferring strategies per candidate table.
+_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+}
+
+def _compile_linear(pattern, flags=0):
+    """Compile with google-re2 when available, else stdlib ``re``.
+
+    The progressive extractors run over whole-document OCR text where a
+    backtracking engine can blow up on noisy input; RE2 guarantees
+    linear time. Patterns RE2 cannot express fall back to ``re``.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:  # pragma: no cover - re2 unsupported construct
+            pass
+    return re.compile(pattern, flags)
+
+
+# Compiled once at import: the stdlib re cache still charges a probe and
+# flag handling per call, which shows up when a batch run walks
+# thousands of SAC filings through the fallback extractors.
+# All four RUT strategies fused into one alternation so the fallback
+# text is scanned once; ``lastgroup`` names the strategy that hit and
+# _RUT_PRIORITY preserves the old labeled > dotted > no-dots > loose
+# preference when several strategies match at different offsets.
+_RUT_ANY_RE = re.compile(
+    r"RUT[:\s]*(?P<labeled>\d{1,2}\.\d{3}\.\d{3}-[\dkK])"
+    r"|(?P<dotted>\d{1,2}\.\d{3}\.\d{3}-[\dkK])"
+    r"|(?P<nodots>\d{7,8}-[\dkK])"
+    r"|(?P<loose>(\d{1,2})[.\s]?(\d{3})[.\s]?(\d{3})\s?-?\s?([\dkK]))",
+    re.IGNORECASE,
+)
+_RUT_PRIORITY = {"labeled": 0, "dotted": 1, "nodots": 2, "loose": 3}
+
+# The razón-social and project-name strategies, fused into one
+# alternation per field. A single finditer pass collects candidates from
+# every strategy at once; the priority tuples rank them so the strict
+# labelled form still beats a keyword hit found earlier in the text.
+# Each alternative is lookahead-wrapped so matches stay zero-width:
+# finditer is non-overlapping, and a consuming low-priority hit could
+# otherwise swallow a later, higher-priority label. The keyword classes
+# use an explicit space rather than \s so they cannot run across line
+# breaks into label text.
+_RAZON_ANY_RE = _compile_linear(
+    r"(?=(?i:raz[oó]n\s+social[:\s]*(?P<strict>[A-ZÁÉÍÓÚÑ][A-Za-záéíóúñ\s\.,&-]+?)(?=\n|RUT|Giro)))"
+    r"|(?=(?i:raz[oó]n\s+social[:\s]*(?P<line>.+)))"
+    r"|(?=(?i:raz[oó]n\s+social\s*\n+(?P<nextline>[^\n]{3,120})))"
+    r"|(?=(?P<keyword>[A-ZÁÉÍÓÚÑ][A-Za-záéíóúñ \.,&-]{2,80}? (?:S\.?A\.?|SpA\.?|LTDA\.?|Limitada|E\.?I\.?R\.?L\.?)))"
+)
+_RAZON_PRIORITY = ("strict", "line", "keyword", "nextline")
+_RAZON_MIN_LEN = {"strict": 3, "line": 3}
+
+_PROYECTO_ANY_RE = _compile_linear(
+    r"(?=(?i:nombre\s+del\s+proyecto[:\s]*(?P<strict>.+?)(?=\n|Potencia|Tipo)))"
+    r"|(?=(?i:nombre\s+del\s+proyecto[:\s]*(?P<line>.+)))"
+    r"|(?=(?i:proyecto[:\s]+(?P<short>[^\n]{3,120})))"
+    r"|(?=(?i:(?P<keyword>(?:PMGD|Parque|Planta|Central) (?:Solar|Fotovoltaic[oa]|E[oó]lic[oa]|Hidro\w*)?[^\n]{0,80})))"
+)
+_PROYECTO_PRIORITY = ("strict", "line", "short", "keyword")
+_PROYECTO_MIN_LEN = {"strict": 3, "line": 3}
+
+# One-pass C-level character stripping/replacement for the tiny per-row
+# string fixups.
+_RUT_STRIP = str.maketrans("", "", ". -")
+
+# Label spellings drift between accented and unaccented across form
+# revisions; folding the accents once per row halves the dispatch keys.
+_ACCENT_TABLE = str.maketrans("áéíóúñÁÉÍÓÚÑ", "aeiounAEIOUN")
+_DECIMAL_FIX = str.maketrans({",": "."})
+
+# Month lengths for the hand-rolled date validation (February handled
+# with the leap-year test inline).
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_DATE_RE = re.compile(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})")
+_DECIMAL_RE = re.compile(r"[-+]?\d*\.?\d+")
+_COORD_RE = re.compile(r"\d{1,3}(?:\.\d{3})+(?:,\d+)?|\d+(?:,\d+)?")
+
+
+# SAC scans are typed forms with a known grid: --psm 6 (uniform text
+# block) skips Tesseract's layout analysis and --oem 1 forces the faster
+# LSTM engine.
+_OCR_CONFIG = "--psm 6 --oem 1 -c preserve_interword_spaces=1"
+
+
+@functools.lru_cache(maxsize=None)
+def _try_import_ocr():
+    """Import the OCR stack on first use; None when it is not installed.
+
+    Memoized so the common non-OCR path never pays the pdf2image and
+    pytesseract (plus Pillow) import cost, and a missing stack is only
+    probed once per process.
+    """
+    try:
+        import pdf2image
+        import pytesseract
+    except ImportError:
+        return None
+    return pdf2image, pytesseract
+
+
+@functools.lru_cache(maxsize=None)
+def _try_import_pikepdf():
+    """Import pikepdf on first use; None when it is not installed."""
+    try:
+        import pikepdf
+    except ImportError:
+        return None
+    return pikepdf
+
+
+@functools.lru_cache(maxsize=None)
+def _try_import_pypdf():
+    """Import pypdf on first use; None when it is not installed."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    return PdfReader
+
+
+def _scan_alternation(pattern, text, priority, min_lengths):
+    """Single-pass candidate scan over a fused strategy alternation.
+
+    Every match names its strategy via ``lastgroup``; the best-ranked
+    candidate that clears its minimum length wins, and the scan stops as
+    soon as the top strategy has fired.
+    """
+    ranks = {name: i for i, name in enumerate(priority)}
+    best = None
+    best_rank = len(priority)
+    for match in pattern.finditer(text):
+        rank = ranks.get(match.lastgroup, best_rank)
+        if rank >= best_rank:
+            continue
+        value = match.group(match.lastgroup).strip()
+        if len(value) < min_lengths.get(match.lastgroup, 1):
+            continue
+        best, best_rank = value, rank
+        if best_rank == 0:
+            break
+    return best
+
+
+def _ocr_one(image_path):
+    """OCR one rendered page from disk (module scope so the pool can pickle it).
+
+    Taking a path instead of a PIL image keeps resident memory at one
+    page regardless of document length; the page file is deleted as soon
+    as its text is out.
+    """
+    import pytesseract
+    from PIL import Image
+
+    try:
+        with Image.open(image_path) as image:
+            # Binarize before OCR: thresholded 1-bit input is both smaller
+            # and closer to what Tesseract's classifier was trained on.
+            image = image.convert("L").point(lambda p: 255 if p > 180 else 0, mode="1")
+            return pytesseract.image_to_string(image, lang="spa", config=_OCR_CONFIG)
+    finally:
+        os.unlink(image_path)
+
+
+def _parse_one(pdf_path):
+    """Parse one SAC in a worker process (module scope keeps it picklable)."""
+    return SACPDFParser().parse(pdf_path)
+
+
+class SACPDFParser:
+    """Extract structured fields from a SAC form PDF."""
+
+    # Fields that must be recovered before a filing can be loaded; their
+    # absence is what justifies the expensive fallback passes.
+    _CRITICAL = frozenset({"razon_social", "rut", "nombre_proyecto"})
+
+    def __init__(self, backend="pymupdf"):
+        self.version = "1.0.0"
+        # PyMuPDF extracts the same Excel-generated grid orders of
+        # magnitude faster than pdfplumber; the latter stays available
+        # as an explicit choice and as the fallback when PyMuPDF is not
+        # installed.
+        self.backend = backend if pymupdf is not None else "pdfplumber"
+        self.cache_dir = Path(os.environ.get("SAC_CACHE_DIR", ".cache/sac"))
+        # Exact labels resolve in one dict lookup; the short ordered
+        # fuzzy list keeps the old elif precedence for labels matched by
+        # substring.
+        self._exact_handlers = {
+            "rut": self._h_rut,
+            "giro": self._h_giro,
+            "comuna": self._h_comuna,
+            "region": self._h_region,
+            "e-mail": self._h_email,
+            "email": self._h_email,
+            "telefono": self._h_telefono,
+            "fecha": self._h_fecha,
+        }
+        # Fuzzy labels all start the cell, so a prefix compare
+        # short-circuits on the first differing character instead of a
+        # full substring scan.
+        self._fuzzy_handlers = (
+            ("razon social", self._h_razon_social),
+            ("domicilio legal", self._h_domicilio),
+            ("representante legal", self._h_representante),
+            ("nombre del representante legal", self._h_representante),
+            ("nombre coordinador", self._h_coordinador),
+            ("coordinador", self._h_coordinador),
+            ("nombre del proyecto", self._h_nombre_proyecto),
+            ("tipo tecnologia", self._h_tecnologia),
+            ("potencia nominal", self._h_potencia_nominal),
+            ("consumo propio", self._h_consumo_propio),
+            ("coordenadas u.t.m.", self._h_utm),
+            ("coordenadas utm", self._h_utm),
+            ("punto de conexion", self._h_punto_conexion),
+            ("nivel de tension", self._h_tension),
+            ("fecha estimada de conexion", self._h_fecha_estimada),
+        )
+        # With pyahocorasick installed, all fuzzy keywords are matched in
+        # one automaton pass over the label instead of one startswith per
+        # keyword; a hit is only honoured when the keyword opens the
+        # label, preserving the prefix semantics.
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for prefix, handler in self._fuzzy_handlers:
+                automaton.add_word(prefix, (len(prefix) - 1, handler))
+            automaton.make_automaton()
+            self._fuzzy_automaton = automaton
+        else:
+            self._fuzzy_automaton = None
+        # Pure-Python fallback: bucket the keywords by their first eight
+        # characters so an unmatched label costs one dict probe plus at
+        # most a couple of startswith checks instead of a scan of the
+        # whole keyword table. Every fuzzy keyword is at least eight
+        # characters long, which keeps the fingerprint unambiguous.
+        fingerprints = {}
+        for prefix, handler in self._fuzzy_handlers:
+            fingerprints.setdefault(prefix[:8], []).append((prefix, handler))
+        self._fuzzy_fp = {fp: tuple(entries) for fp, entries in fingerprints.items()}
+
+    def parse(self, pdf_path, force_refresh=False):
+        """Parse a SAC PDF and return a dict of extracted fields.
+
+        Parses are memoized on disk under a content hash of the PDF
+        bytes, so reprocessing runs over an unchanged intake folder cost
+        one hash plus a JSON read per file. ``force_refresh=True``
+        re-parses and overwrites the entry.
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        digest = hashlib.blake2b(pdf_file.read_bytes(), digest_size=16).hexdigest()
+        cache_path = self.cache_dir / f"{digest}.json"
+        if not force_refresh and cache_path.exists():
+            try:
+                return json.loads(cache_path.read_text())
+            except (OSError, ValueError):
+                pass
+
+        data, cacheable = self._parse_uncached(pdf_path, pdf_file)
+        if cacheable:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps(data))
+            except OSError as exc:
+                logger.warning(f"Could not write parse cache for {pdf_file.name}: {exc}")
+        return data
+
+    def _parse_uncached(self, pdf_path, pdf_file):
+        """Parse ``pdf_path``; returns ``(data, cacheable)``.
+
+        ``cacheable`` is False when the result reflects a missing
+        optional dependency rather than the document itself, so the
+        cache never pins an environment-dependent failure.
+        """
+        if self.backend == "pymupdf":
+            data, page_text = self._extract_with_pymupdf(pdf_path)
+        else:
+            data, page_text = self._extract_with_pdfplumber(pdf_path)
+
+        if self._is_scanned_pdf_from_text(page_text) and not self._is_digital_producer(
+            data.get("pdf_producer")
+        ):
+            logger.info(f"Scanned SAC detected, using OCR: {pdf_file.name}")
+            # Without the OCR extra this yields nothing; caching that
+            # would keep returning {} even after the deps are installed.
+            return self._parse_with_ocr(pdf_path), _try_import_ocr() is not None
+
+        missing_critical = [f for f in self._CRITICAL if not data.get(f)]
+        if not missing_critical:
+            # Common success path: every critical field came out of the
+            # table, so skip the second full pass through the PDF.
+            return data, True
+
+        logger.info(f"Missing critical fields {missing_critical}, trying pypdf fallback")
+        fallback_data = self._parse_with_pypdf_fallback(pdf_path, preextracted_text=page_text)
+        for field in missing_critical:
+            if fallback_data.get(field):
+                data[field] = fallback_data[field]
+        return data, True
+
+    @staticmethod
+    def parse_metadata_only(pdf_path):
+        """Read just the producer and creation date of a SAC PDF.
+
+        Indexing and cache-refresh flows only need the /Info dictionary;
+        pikepdf (QPDF) reads it without touching content streams. When
+        pikepdf is absent the metadata comes from whichever full backend
+        is available, which is still far cheaper than a full parse.
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        parser = SACPDFParser()
+        pikepdf = _try_import_pikepdf()
+        if pikepdf is not None:
+            with pikepdf.open(pdf_path) as pdf:
+                info = pdf.docinfo
+                producer = str(info.get("/Producer", "")) or None
+                creation = str(info.get("/CreationDate", "")) or None
+                return {
+                    "pdf_producer": producer,
+                    "pdf_creation_date": parser._parse_pdf_date(creation),
+                }
+        if pymupdf is not None:
+            doc = pymupdf.open(pdf_path)
+            try:
+                metadata = doc.metadata or {}
+                return {
+                    "pdf_producer": metadata.get("producer"),
+                    "pdf_creation_date": parser._parse_pdf_date(metadata.get("creationDate")),
+                }
+            finally:
+                doc.close()
+        with pdfplumber.open(pdf_path, pages=[1]) as pdf:
+            metadata = pdf.metadata or {}
+            return {
+                "pdf_producer": metadata.get("Producer"),
+                "pdf_creation_date": parser._parse_pdf_date(metadata.get("CreationDate")),
+            }
+
+    @classmethod
+    def parse_many(cls, paths, workers=None):
+        """Parse a batch of SAC PDFs across a process pool.
+
+        Results come back in input order. Worker count defaults to the
+        CPU count; each worker builds its own parser, which is cheap now
+        that instances hold no per-parse state.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_one, paths, chunksize=4))
+
+    def _extract_with_pymupdf(self, pdf_path):
+        """Extract metadata, first-page text and the SAC table via PyMuPDF."""
+        doc = pymupdf.open(pdf_path)
+        try:
+            if doc.page_count == 0:
+                return {}, ""
+            metadata = doc.metadata or {}
+            data = {
+                "pdf_producer": metadata.get("producer"),
+                "pdf_creation_date": self._parse_pdf_date(metadata.get("creationDate")),
+            }
+            page = doc[0]
+            page_text = page.get_text() or ""
+            if self._is_scanned_pdf_from_text(page_text) and not self._is_digital_producer(
+                data["pdf_producer"]
+            ):
+                return data, page_text
+
+            tabs = page.find_tables()
+            if tabs.tables:
+                data.update(self._parse_table(tabs[0].extract(), producer=data["pdf_producer"]))
+            return data, page_text
+        finally:
+            doc.close()
+
+    def _extract_with_pdfplumber(self, pdf_path):
+        """pdfplumber twin of :meth:`_extract_with_pymupdf`."""
+        data = {}
+        page_text = ""
+        # pages=[1] keeps pdfminer from resolving every page object when
+        # a multi-page variant shows up; only the form page is needed.
+        with pdfplumber.open(pdf_path, pages=[1]) as pdf:
+            if not pdf.pages:
+                return data, page_text
+            metadata = pdf.metadata or {}
+            data["pdf_producer"] = metadata.get("Producer")
+            data["pdf_creation_date"] = self._parse_pdf_date(metadata.get("CreationDate"))
+
+            page = pdf.pages[0]
+            page_text = page.extract_text() or ""
+            if self._is_scanned_pdf_from_text(page_text) and not self._is_digital_producer(
+                data["pdf_producer"]
+            ):
+                return data, page_text
+
+            # extract_table (singular) stops at the best-scoring grid
+            # instead of materializing every candidate table.
+            table = page.extract_table(table_settings=_TABLE_SETTINGS)
+            if table:
+                data.update(self._parse_table(table, producer=data["pdf_producer"]))
+        return data, page_text
+
+    def _is_scanned_pdf_from_text(self, page_text):
+        """Heuristic: a SAC with almost no extractable text is a scan."""
+        return len(page_text.strip()) < 50
+
+    @staticmethod
+    def _is_digital_producer(producer):
+        """True for producers that only emit digitally-generated PDFs.
+
+        SACs come out of Excel; a Microsoft/Adobe producer string means
+        the file cannot be a scan, so the OCR branch can be skipped
+        outright and the canonical table layout can be trusted.
+        """
+        return bool(producer) and str(producer).startswith(("Microsoft", "Adobe"))
+
+    # Canonical row order of the Excel SAC template: (row, label prefix,
+    # field, converter). The fast path verifies every label before
+    # trusting its position, so any template drift falls back to the
+    # fuzzy dispatch walk.
+    _SAC_LAYOUT = (
+        (0, "razon social", "razon_social", None),
+        (1, "rut", "rut", "rut"),
+        (2, "giro", "giro", None),
+        (3, "domicilio legal", "domicilio_legal", None),
+        (4, "comuna", "comuna", None),
+        (5, "region", "region", None),
+        (6, "nombre del representante legal", "representante_legal", None),
+        (7, "e-mail", "email", None),
+        (8, "telefono", "telefono", None),
+        (9, "nombre del proyecto", "nombre_proyecto", None),
+        (10, "tipo tecnologia", "tipo_tecnologia", None),
+        (11, "potencia nominal", "potencia_nominal_mw", "decimal"),
+        (12, "consumo propio", "consumo_propio_kw", "decimal"),
+        (13, "coordenadas u.t.m.", None, "utm"),
+        (14, "punto de conexion", "punto_conexion", None),
+        (15, "nivel de tension", "nivel_tension_kv", "decimal"),
+        (16, "fecha estimada de conexion", "fecha_conexion_estimada", "date"),
+        (17, "fecha", "fecha_presentacion", "date"),
+    )
+
+    def _parse_table(self, table, producer=None):
+        """Map the labelled SAC table onto the canonical field names."""
+        if self._is_digital_producer(producer):
+            data = self._parse_table_canonical(table)
+            if data is not None:
+                # The fixed layout only covers the static block; any
+                # trailing rows (the numbered coordinator contacts) still
+                # go through the generic walk.
+                return self._parse_rows(table[len(self._SAC_LAYOUT):], data)
+        return self._parse_rows(table, {})
+
+    def _parse_rows(self, table, data):
+        """Generic labelled walk over ``table`` rows, filling ``data``."""
+        # Coordinator counter as a one-cell list: local to this call, so
+        # the parser stays reentrant, while still mutable by handlers.
+        next_coord = [0]
+        # Excel-exported grids are full of empty separator rows; drop
+        # them in one pass instead of testing inside the hot loop.
+        rows = [row for row in table if row and len(row) >= 2]
+        for row in rows:
+            # Pad every row to the full SAC column count so handlers can
+            # index positional cells without per-access length guards.
+            # Both backends hand back str-or-None cells, so the str()
+            # coercion is only paid when something else sneaks in.
+            if all(cell is None or type(cell) is str for cell in row):
+                cells = tuple(cell.strip() if cell else "" for cell in row)
+            else:
+                cells = tuple(str(cell).strip() if cell else "" for cell in row)
+            clean_row = (cells + ("",) * _ROW_WIDTH)[:_ROW_WIDTH]
+            label = clean_row[1].translate(_ACCENT_TABLE).lower()
+            value = clean_row[2]
+
+            handler = self._exact_handlers.get(label)
+            if handler is None:
+                if self._fuzzy_automaton is not None:
+                    for end, (last, fuzzy_handler) in self._fuzzy_automaton.iter(label):
+                        if end == last:  # keyword sits at the start of the label
+                            handler = fuzzy_handler
+                            break
+                else:
+                    entries = self._fuzzy_fp.get(label[:8])
+                    if entries:
+                        for prefix, fuzzy_handler in entries:
+                            if label.startswith(prefix):
+                                handler = fuzzy_handler
+                                break
+            if handler is not None:
+                handler(data, clean_row, label, value, next_coord)
+                # No early exit here: the numbered coordinador_proyecto_N
+                # rows trail the fixed block, so every row must be seen.
+
+        return data
+
+    def _parse_table_canonical(self, table):
+        """Extract by fixed position from the canonical Excel layout.
+
+        Returns None on the first label that is not where the template
+        puts it, in which case the caller re-runs the generic walk.
+        """
+        if len(table) < len(self._SAC_LAYOUT):
+            return None
+        data = {}
+        for row_idx, prefix, field, conv in self._SAC_LAYOUT:
+            row = table[row_idx]
+            if not row or len(row) < 3:
+                return None
+            label = str(row[1]).strip().translate(_ACCENT_TABLE).lower() if row[1] else ""
+            if not label.startswith(prefix):
+                return None
+            value = str(row[2]).strip() if row[2] else ""
+            if conv is None:
+                if value:
+                    data[field] = value
+            elif conv == "rut":
+                if value:
+                    data[field] = self._normalize_rut(value)
+            elif conv == "decimal":
+                parsed = self._parse_decimal(value)
+                if parsed is not None:
+                    data[field] = parsed
+            elif conv == "date":
+                parsed = self._parse_date(value)
+                if parsed:
+                    data[field] = parsed
+            elif conv == "utm":
+                este = self._parse_coordinate(value)
+                if este is not None:
+                    data["utm_este"] = este
+                if len(row) > 5 and row[4] and "norte" in str(row[4]).lower():
+                    norte = self._parse_coordinate(str(row[5]).strip() if row[5] else "")
+                    if norte is not None:
+                        data["utm_norte"] = norte
+        return data
+
+    # --- per-label row handlers --------------------------------------
+
+    def _h_razon_social(self, data, clean_row, label, value, next_coord):
+        if value and len(value) >= 3:
+            data["razon_social"] = value
+
+    def _h_rut(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["rut"] = self._normalize_rut(value)
+
+    def _h_giro(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["giro"] = value
+
+    def _h_domicilio(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["domicilio_legal"] = value
+
+    def _h_comuna(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["comuna"] = value
+
+    def _h_region(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["region"] = value
+
+    def _h_representante(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["representante_legal"] = value
+
+    def _h_coordinador(self, data, clean_row, label, value, next_coord):
+        if "nombre" not in label:
+            return
+        next_coord[0] += 1
+        if value:
+            data[f"coordinador_proyecto_{next_coord[0]}_nombre"] = value
+
+    def _h_email(self, data, clean_row, label, value, next_coord):
+        if next_coord[0]:
+            if value:
+                data[f"coordinador_proyecto_{next_coord[0]}_email"] = value
+        elif value:
+            data["email"] = value
+
+    def _h_telefono(self, data, clean_row, label, value, next_coord):
+        if next_coord[0]:
+            if value:
+                data[f"coordinador_proyecto_{next_coord[0]}_telefono"] = value
+        elif value:
+            data["telefono"] = value
+
+    def _h_nombre_proyecto(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["nombre_proyecto"] = value
+
+    def _h_tecnologia(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["tipo_tecnologia"] = value
+
+    def _h_potencia_nominal(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_decimal(value)
+        if parsed is not None:
+            data["potencia_nominal_mw"] = parsed
+
+    def _h_consumo_propio(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_decimal(value)
+        if parsed is not None:
+            data["consumo_propio_kw"] = parsed
+
+    def _h_utm(self, data, clean_row, label, value, next_coord):
+        este = self._parse_coordinate(value)
+        if este is not None:
+            data["utm_este"] = este
+        if "norte" in clean_row[4].lower():
+            norte = self._parse_coordinate(clean_row[5])
+            if norte is not None:
+                data["utm_norte"] = norte
+
+    def _h_punto_conexion(self, data, clean_row, label, value, next_coord):
+        if value:
+            data["punto_conexion"] = value
+
+    def _h_tension(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_decimal(value)
+        if parsed is not None:
+            data["nivel_tension_kv"] = parsed
+
+    def _h_fecha_estimada(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_date(value)
+        if parsed:
+            data["fecha_conexion_estimada"] = parsed
+
+    def _h_fecha(self, data, clean_row, label, value, next_coord):
+        parsed = self._parse_date(value)
+        if parsed:
+            data["fecha_presentacion"] = parsed
+
+    def _parse_with_ocr(self, pdf_path):
+        """Recover the critical fields from a scanned SAC via OCR."""
+        ocr = _try_import_ocr()
+        if ocr is None:
+            logger.warning("OCR dependencies not installed; cannot parse scanned PDF")
+            return {}
+        pdf2image, _ = ocr
+
+        data = {}
+        with tempfile.TemporaryDirectory(prefix="sac_ocr_") as tmpdir:
+            # 200 DPI is plenty for typed forms and OCR cost scales
+            # roughly quadratically with resolution. paths_only renders
+            # straight to disk so no page is ever held as a PIL image
+            # on this side of the pool.
+            page_paths = pdf2image.convert_from_path(
+                pdf_path,
+                dpi=200,
+                grayscale=True,
+                fmt="png",
+                output_folder=tmpdir,
+                paths_only=True,
+            )
+            if not page_paths:
+                return data
+            if len(page_paths) == 1:
+                full_text = _ocr_one(page_paths[0])
+            else:
+                workers = min(len(page_paths), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    full_text = "\n".join(executor.map(_ocr_one, page_paths))
+
+        rut = self._extract_rut_progressive(full_text)
+        if rut:
+            data["rut"] = rut
+        razon_social = self._extract_razon_social_progressive(full_text)
+        if razon_social:
+            data["razon_social"] = razon_social
+        nombre_proyecto = self._extract_nombre_proyecto_progressive(full_text)
+        if nombre_proyecto:
+            data["nombre_proyecto"] = nombre_proyecto
+        return data
+
+    def _parse_with_pypdf_fallback(self, pdf_path, preextracted_text=None):
+        """Mine raw text with the progressive regexes.
+
+        When ``preextracted_text`` is supplied (the pdfplumber text the
+        caller already has in hand — SACs are single-page), the pypdf
+        re-read of the file is skipped entirely.
+        """
+        if preextracted_text:
+            full_text = preextracted_text
+        else:
+            PdfReader = _try_import_pypdf()
+            if PdfReader is None:
+                return {}
+
+            try:
+                reader = PdfReader(pdf_path)
+                full_text = ""
+                for page in reader.pages:
+                    full_text += (page.extract_text() or "") + "\n"
+            except Exception as exc:
+                logger.warning(f"pypdf fallback failed for {pdf_path}: {exc}")
+                return {}
+
+        data = {}
+        rut = self._extract_rut_progressive(full_text)
+        if rut:
+            data["rut"] = rut
+        razon_social = self._extract_razon_social_progressive(full_text)
+        if razon_social:
+            data["razon_social"] = razon_social
+        nombre_proyecto = self._extract_nombre_proyecto_progressive(full_text)
+        if nombre_proyecto:
+            data["nombre_proyecto"] = nombre_proyecto
+        return data
+
+    def _extract_rut_progressive(self, text):
+        """Locate a RUT with one pass of the fused strategy alternation."""
+        best = None
+        best_rank = len(_RUT_PRIORITY)
+        for match in _RUT_ANY_RE.finditer(text):
+            rank = _RUT_PRIORITY[match.lastgroup]
+            if rank < best_rank:
+                best, best_rank = match, rank
+                if rank == 0:
+                    break
+        if best is None:
+            return None
+        if best.lastgroup == "loose":
+            # Groups 5-8 are the digit runs inside the loose alternative.
+            return self._normalize_rut("".join(best.group(5, 6, 7, 8)))
+        return self._normalize_rut(best.group(best.lastgroup))
+
+    def _extract_razon_social_progressive(self, text):
+        """Locate the razón social in one pass over the strategy alternation."""
+        return _scan_alternation(_RAZON_ANY_RE, text, _RAZON_PRIORITY, _RAZON_MIN_LEN)
+
+    def _extract_nombre_proyecto_progressive(self, text):
+        """Locate the project name in one pass over the strategy alternation."""
+        return _scan_alternation(
+            _PROYECTO_ANY_RE, text, _PROYECTO_PRIORITY, _PROYECTO_MIN_LEN
+        )
+
+    def _normalize_rut(self, rut):
+        """Normalize a RUT to the dotted ``NN.NNN.NNN-D`` form."""
+        if not rut:
+            return rut
+        rut_clean = rut.upper().translate(_RUT_STRIP)
+        if len(rut_clean) < 2:
+            return rut
+        cuerpo = rut_clean[:-1]
+        dv = rut_clean[-1]
+        if not cuerpo.isdigit():
+            return rut
+        # int.__format__ with ',' grouping splits the thousands in C.
+        return f"{int(cuerpo):,}-{dv}".replace(",", ".")
+
+    def _parse_date(self, value):
+        """Parse a DD-MM-YYYY / DD/MM/YYYY form date into ISO format."""
+        if not value:
+            return None
+        text = str(value).strip()
+        # Fast path: the common zero-padded form-cell date is sliced
+        # apart directly; the regex only runs for irregular input.
+        if len(text) == 10 and text[2] in "-/" and text[5] == text[2]:
+            try:
+                day, month, year = int(text[:2]), int(text[3:5]), int(text[6:])
+            except ValueError:
+                pass
+            else:
+                return self._format_dmy(day, month, year)
+        match = _DATE_RE.search(text)
+        if not match:
+            return None
+        return self._format_dmy(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+    def _format_dmy(self, day, month, year):
+        """Validate day/month/year and emit the ISO string."""
+        if month > 12 and day <= 12:
+            day, month = month, day
+        if not 1 <= month <= 12:
+            return None
+        max_day = _DAYS_IN_MONTH[month]
+        if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            max_day = 29
+        if not 1 <= day <= max_day:
+            return None
+        return f"{year}-{month:02d}-{day:02d}"
+
+    def _parse_pdf_date(self, value):
+        """Parse a PDF metadata date (``D:YYYYMMDDHHMMSS...``) into ISO format."""
+        if not value:
+            return None
+        value = str(value)
+        if value.startswith("D:"):
+            value = value[2:]
+        # The producer field is a fixed-width digit run; slicing it apart
+        # avoids strptime's locale machinery entirely.
+        date_part = value[:14]
+        if len(date_part) >= 8 and date_part[:8].isdigit():
+            year, month, day = date_part[:4], date_part[4:6], date_part[6:8]
+            if "01" <= month <= "12" and "01" <= day <= "31":
+                if len(date_part) == 14 and date_part.isdigit():
+                    hour, minute, second = date_part[8:10], date_part[10:12], date_part[12:14]
+                    if hour < "24" and minute < "60" and second < "60":
+                        return f"{year}-{month}-{day} {hour}:{minute}:{second}"
+                return f"{year}-{month}-{day}"
+        return None
+
+    def _parse_decimal(self, value):
+        """Parse a numeric cell that may use a decimal comma."""
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        cleaned = str(value).translate(_DECIMAL_FIX).strip()
+        # Most cells are bare numbers; let float() handle those and keep
+        # the regex for values with embedded units.
+        try:
+            return float(cleaned)
+        except ValueError:
+            pass
+        match = _DECIMAL_RE.search(cleaned)
+        if match:
+            try:
+                return float(match.group())
+            except ValueError:
+                return None
+        return None
+
+    def _parse_coordinate(self, value):
+        """Parse a UTM coordinate cell, tolerating thousand-separator dots."""
+        if not value:
+            return None
+        cleaned = str(value).strip()
+        # UTM cells use dots as thousand separators ("345.678,5 m E").
+        match = _COORD_RE.search(cleaned)
+        if not match:
+            return None
+        return self._parse_decimal(match.group().replace(".", ""))
+
+
+def parse_sac_pdf(pdf_path):
+    """Parse one SAC PDF; convenience wrapper used by ingestion jobs."""
+    return SACPDFParser().parse(pdf_path)
+
+
+def parse_sac_pdfs(paths, max_workers=None):
+    """Parse a directory's worth of SAC PDFs across worker processes.
+
+    Function-level counterpart of :meth:`SACPDFParser.parse_many` for
+    ingestion jobs that already work with the module-level wrappers.
+    """
+    return SACPDFParser.parse_many(paths, workers=max_workers)
+
+
+def parse_sac_pdfs_joblib(paths, n_jobs=-1):
+    """Batch-parse SAC PDFs through joblib's loky workers.
+
+    loky keeps its worker processes alive between calls, so pipelines
+    that parse directory after directory skip the pool start-up that
+    :func:`parse_sac_pdfs` pays each time. Falls back to the plain
+    process pool when joblib is not installed.
+    """
+    paths = list(paths)
+    if Parallel is None:
+        return SACPDFParser.parse_many(paths)
+    return Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(
+        delayed(parse_sac_pdf)(path) for path in paths
+    )
@@ -0,0 +1,244 @@
+"""Parser for SCR ("Solicitud de Conexión a la Red") form PDFs.
+
+Unlike SAC forms, SCR filings do not share a canonical grid: each
+distribution company lays the table out differently, labels drift between
+columns, and the value may sit one or several cells to the right of its
+label. The parser therefore scans every row for known label keywords and
+takes the first non-empty cell after the hit as the value.
+"""
+
+import logging
+import re
+from pathlib import Path
+
+import pdfplumber
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is an optional speedup
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+# Every label keyword the row scan knows, mapped to its canonical field.
+# Keyword order mirrors the old per-field scan order so the fallback
+# path resolves ties identically.
+# One spec per harvested field: (field, min_length, parser, prerequisite
+# field). The row loop walks only the specs still missing and stops the
+# whole table scan once every field is filled.
+_FIELD_SPECS = (
+    ("razon_social", 3, None, None),
+    ("rut", 1, "rut", None),
+    ("giro", 1, None, None),
+    ("domicilio_legal", 1, None, None),
+    ("comuna", 1, None, None),
+    ("region", 1, None, None),
+    ("representante_legal", 1, None, None),
+    ("nombre_proyecto", 1, None, None),
+    ("tipo_tecnologia", 1, None, None),
+    ("potencia_mw", 1, "decimal", None),
+    ("punto_conexion", 1, None, None),
+    ("nivel_tension_kv", 1, "decimal", None),
+    ("coordinador_nombre", 1, None, None),
+    # Emails belong to the coordinator block; require its name first.
+    ("coordinador_email", 1, None, "coordinador_nombre"),
+    ("fecha_conexion_estimada", 1, "date", None),
+)
+
+_LABEL_KEYWORDS = (
+    ("razón social", "razon_social"),
+    ("razon social", "razon_social"),
+    ("rut", "rut"),
+    ("giro", "giro"),
+    ("domicilio", "domicilio_legal"),
+    ("comuna", "comuna"),
+    ("región", "region"),
+    ("region", "region"),
+    ("representante legal", "representante_legal"),
+    ("nombre del proyecto", "nombre_proyecto"),
+    ("nombre proyecto", "nombre_proyecto"),
+    ("tipo tecnología", "tipo_tecnologia"),
+    ("tipo tecnologia", "tipo_tecnologia"),
+    ("tecnología", "tipo_tecnologia"),
+    ("tecnologia", "tipo_tecnologia"),
+    ("potencia", "potencia_mw"),
+    ("punto de conexión", "punto_conexion"),
+    ("punto de conexion", "punto_conexion"),
+    ("nivel de tensión", "nivel_tension_kv"),
+    ("nivel de tension", "nivel_tension_kv"),
+    ("coordinador", "coordinador_nombre"),
+    ("e-mail", "coordinador_email"),
+    ("email", "coordinador_email"),
+    ("correo", "coordinador_email"),
+    ("fecha estimada", "fecha_conexion_estimada"),
+)
+
+
+class SCRPDFParser:
+    """Extract structured fields from an SCR form PDF."""
+
+    def __init__(self):
+        self.version = "1.0.0"
+        # With pyahocorasick installed, each cell is scanned for every
+        # keyword in a single automaton pass; otherwise a plain keyword
+        # loop covers the same table.
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword, field in _LABEL_KEYWORDS:
+                automaton.add_word(keyword, field)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._automaton = None
+
+    def parse(self, pdf_path):
+        """Parse an SCR PDF and return a dict of extracted fields."""
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        data = {}
+        with pdfplumber.open(pdf_path) as pdf:
+            metadata = pdf.metadata or {}
+            data["pdf_producer"] = metadata.get("Producer")
+
+            for page in pdf.pages:
+                tables = page.extract_tables()
+                for table in tables:
+                    data.update(self._parse_table(table))
+        return data
+
+    def _parse_table(self, table):
+        """Scan each row for known labels and harvest their values."""
+        data = {}
+        missing = set(spec[0] for spec in _FIELD_SPECS)
+        for row in table:
+            if not row:
+                continue
+            hits = self._row_label_hits(row)
+            if not hits:
+                continue
+
+            for field, min_len, parser, requires in _FIELD_SPECS:
+                if field not in missing:
+                    continue
+                idx = hits.get(field)
+                if idx is None:
+                    continue
+                if requires and not data.get(requires):
+                    continue
+                value = self._find_value_in_row(row, idx)
+                if not value or len(value) < min_len:
+                    continue
+                if parser == "rut":
+                    data[field] = self._normalize_rut(value)
+                elif parser == "decimal":
+                    parsed = self._parse_decimal(value)
+                    if parsed is None:
+                        continue
+                    data[field] = parsed
+                elif parser == "date":
+                    parsed = self._parse_date(value)
+                    if not parsed:
+                        continue
+                    data[field] = parsed
+                else:
+                    data[field] = value
+                missing.discard(field)
+
+            if not missing:
+                break
+
+        return data
+
+    def _row_label_hits(self, row):
+        """Map every field labelled in this row to its label's cell index.
+
+        One lowercase per cell and one scan per cell (a single automaton
+        pass when pyahocorasick is present) replaces the per-field
+        keyword loops; the first labelled cell wins for each field, as
+        before.
+        """
+        hits = {}
+        for i, cell in enumerate(row):
+            if not cell:
+                continue
+            cell_lower = str(cell).lower()
+            if self._automaton is not None:
+                for _, field in self._automaton.iter(cell_lower):
+                    if field not in hits:
+                        hits[field] = i
+            else:
+                for keyword, field in _LABEL_KEYWORDS:
+                    if field not in hits and keyword in cell_lower:
+                        hits[field] = i
+        return hits
+
+    def _find_label_idx(self, row, keywords):
+        """Return the index of the first cell containing one of the keywords.
+
+        Kept for one-off lookups; the row loop uses the batched
+        :meth:`_row_label_hits` scan instead.
+        """
+        for i, cell in enumerate(row):
+            if not cell:
+                continue
+            cell_lower = str(cell).lower()
+            for keyword in keywords:
+                if keyword in cell_lower:
+                    return i
+        return None
+
+    def _find_value_in_row(self, row, label_idx):
+        """Return the first non-empty cell to the right of the label."""
+        for cell in row[label_idx + 1:]:
+            if cell and str(cell).strip():
+                return str(cell).strip()
+        return None
+
+    def _normalize_rut(self, rut):
+        """Normalize a RUT to the dotted ``NN.NNN.NNN-D`` form."""
+        if not rut:
+            return rut
+        rut_clean = rut.replace(".", "").replace(" ", "").replace("-", "").upper()
+        if len(rut_clean) < 2:
+            return rut
+        cuerpo = rut_clean[:-1]
+        dv = rut_clean[-1]
+        if not cuerpo.isdigit():
+            return rut
+        groups = []
+        while cuerpo:
+            groups.append(cuerpo[-3:])
+            cuerpo = cuerpo[:-3]
+        return f"{'.'.join(reversed(groups))}-{dv}"
+
+    def _parse_date(self, value):
+        """Parse a DD-MM-YYYY / DD/MM/YYYY form date into ISO format."""
+        from datetime import datetime
+
+        if not value:
+            return None
+        match = re.search(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})", str(value))
+        if not match:
+            return None
+        day, month, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        try:
+            return datetime(year, month, day).strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+
+    def _parse_decimal(self, value):
+        """Parse a numeric cell that may use a decimal comma."""
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        cleaned = str(value).replace(",", ".").strip()
+        match = re.search(r"[-+]?\d*\.?\d+", cleaned)
+        if match:
+            try:
+                return float(match.group())
+            except ValueError:
+                return None
+        return None
@@ -0,0 +1,13 @@
+from .interesados import (
+    clear_payload_cache,
+    transform_interesados,
+    transform_interesados_batch,
+    validate_interesado_record,
+)
+
+__all__ = [
+    "clear_payload_cache",
+    "transform_interesados",
+    "transform_interesados_batch",
+    "validate_interesado_record",
+]
@@ -0,0 +1,215 @@
+"""Transform raw "interesados" payloads from the interconnection registry.
+
+The registry API delivers stakeholder records either as a JSON array or,
+in routine-load/CDC pipelines, as one JSON object per message. This module
+normalizes the camelCase API fields into the snake_case records the rest
+of the pipeline (and the database inserters) expect.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import platform
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json as _json
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - fastjsonschema is an optional speedup
+    fastjsonschema = None
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_FIELDS = ["solicitud_id"]
+
+# Presence only: the solicitud_id type check stays in Python because
+# JSON Schema's "integer" accepts 5.0 and rejects bools, which disagrees
+# with the isinstance semantics the rest of the pipeline relies on.
+_RECORD_SCHEMA = {
+    "type": "object",
+    "required": REQUIRED_FIELDS,
+}
+
+# fastjsonschema compiles the schema to straight-line Python, which beats
+# the generic field loop by an order of magnitude on hot paths.
+_compiled_validator = fastjsonschema.compile(_RECORD_SCHEMA) if fastjsonschema else None
+
+
+@dataclass(slots=True, frozen=True)
+class Interesado:
+    """One normalized stakeholder record.
+
+    A slotted, frozen record is roughly a quarter the size of the dict it
+    replaces, which matters when a full registry snapshot (100k+ records)
+    is held in memory at once.
+    """
+
+    solicitud_id: int
+    razon_social: str | None
+    nombre_fantasia: str | None
+
+    def as_dict(self):
+        """Dict view for the DB boundary (inserters bind by key)."""
+        return {
+            "solicitud_id": self.solicitud_id,
+            "razon_social": self.razon_social,
+            "nombre_fantasia": self.nombre_fantasia,
+        }
+
+
+# Routine-load/CDC feeds re-send identical payloads on retries; an LRU
+# keyed by content hash skips the re-parse and re-transform entirely.
+_CACHE_MAX_ENTRIES = 128
+_payload_cache = OrderedDict()
+
+
+def transform_interesados(data, quiet=False):
+    """Normalize raw interesado items into pipeline records.
+
+    ``data`` may be a JSON string/bytes payload, an already-decoded list
+    of raw items, or a single raw item dict. Invalid records are skipped
+    with a warning. Raw payloads are memoized by content hash, so a
+    retried message costs one hash instead of a full parse. Returns a
+    list of :class:`Interesado` records. ``quiet=True`` downgrades the
+    summary log to DEBUG for callers that loop over many payloads.
+    """
+    if isinstance(data, (str, bytes)):
+        raw = data if isinstance(data, bytes) else data.encode()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        cached = _payload_cache.get(digest)
+        if cached is not None:
+            _payload_cache.move_to_end(digest)
+            return list(cached)
+        records = _transform_decoded(_json.loads(raw), quiet=quiet)
+        _payload_cache[digest] = tuple(records)
+        if len(_payload_cache) > _CACHE_MAX_ENTRIES:
+            _payload_cache.popitem(last=False)
+        return records
+    return _transform_decoded(data, quiet=quiet)
+
+
+def clear_payload_cache():
+    """Drop all memoized payload results."""
+    _payload_cache.clear()
+
+
+# Below this size, pickling the slices to worker processes costs more
+# than the per-record loop saves. PyPy's JIT speeds the serial loop up
+# enough that fan-out only pays off on much larger batches.
+_IS_PYPY = platform.python_implementation() == "PyPy"
+_PARALLEL_MIN_RECORDS = 200_000 if _IS_PYPY else 50_000
+
+
+def _transform_decoded(data, quiet=False):
+    if isinstance(data, dict):
+        logger.debug("Wrapping single interesado item")
+        data = (data,)
+    elif not hasattr(data, "__iter__"):
+        data = (data,)
+
+    # Summaries are INFO normally, DEBUG under quiet; either way the
+    # message is only formatted when the level is actually enabled.
+    level = logging.DEBUG if quiet else logging.INFO
+
+    if isinstance(data, (list, tuple)):
+        if len(data) > _PARALLEL_MIN_RECORDS and multiprocessing.cpu_count() > 2:
+            records = _transform_parallel(data)
+        else:
+            records = _transform_chunk(data)
+        if logger.isEnabledFor(level):
+            logger.log(level, "Transformed %d interesados records from %d raw items",
+                       len(records), len(data))
+    else:
+        # Any other iterable (generator, stream) is consumed lazily.
+        records = _transform_chunk(data)
+        if logger.isEnabledFor(level):
+            logger.log(level, "Transformed %d interesados records", len(records))
+    return records
+
+
+def _transform_chunk(items):
+    records = []
+    for item in items:
+        record = {
+            "solicitud_id": item.get("solicitudId"),
+            "razon_social": _clean_text(item.get("razonSocial")),
+            "nombre_fantasia": _clean_text(item.get("nombreFantasia")),
+        }
+        if not validate_interesado_record(record):
+            # %-style so the JIT-hot loop never formats filtered messages.
+            logger.warning("Skipping invalid interesado record: %r", item)
+            continue
+        records.append(Interesado(**record))
+    return records
+
+
+def _transform_parallel(data):
+    """Fan the per-record loop out across one slice per CPU."""
+    workers = multiprocessing.cpu_count()
+    slice_size = -(-len(data) // workers)
+    slices = [data[i:i + slice_size] for i in range(0, len(data), slice_size)]
+    try:
+        # forkserver avoids re-importing the world in each worker.
+        ctx = multiprocessing.get_context("forkserver")
+    except ValueError:  # pragma: no cover - platform without forkserver
+        ctx = multiprocessing.get_context()
+    records = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        for chunk_records in executor.map(_transform_chunk, slices, chunksize=1):
+            records.extend(chunk_records)
+    return records
+
+
+def transform_interesados_batch(payloads):
+    """Transform many raw JSON payloads with a single parser invocation.
+
+    Routine-load/CDC feeds deliver one small JSON document per message;
+    calling :func:`transform_interesados` per message pays the parser
+    warm-up each time. This splices the payloads into one JSON array and
+    parses once. Empty payloads are skipped; array payloads are unwrapped
+    so the result stays a flat array.
+    """
+    parts = []
+    for payload in payloads:
+        raw = payload.encode() if isinstance(payload, str) else payload
+        raw = raw.strip()
+        if not raw:
+            continue
+        if raw.startswith(b"[") and raw.endswith(b"]"):
+            raw = raw[1:-1].strip()
+            if not raw:
+                continue
+        parts.append(raw)
+    if not parts:
+        return []
+    joined = b"[" + b",".join(parts) + b"]"
+    return transform_interesados(_json.loads(joined), quiet=True)
+
+
+def validate_interesado_record(record):
+    """Return True when the record carries every required field."""
+    if _compiled_validator is not None:
+        try:
+            _compiled_validator(record)
+        except fastjsonschema.JsonSchemaException:
+            return False
+    else:
+        for field in REQUIRED_FIELDS:
+            if record.get(field) is None:
+                return False
+    # Both paths end on the same isinstance check so they cannot diverge
+    # on edge values like 5.0 or True.
+    return isinstance(record.get("solicitud_id"), int)
+
+
+def _clean_text(value):
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
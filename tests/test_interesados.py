@@ -0,0 +1,127 @@
+import json
+
+from energyintel.transform.interesados import (
+    Interesado,
+    clear_payload_cache,
+    transform_interesados,
+    transform_interesados_batch,
+    validate_interesado_record,
+)
+
+
+def test_transform_list_of_items():
+    raw = [
+        {"solicitudId": 1, "razonSocial": "  ACME SpA ", "nombreFantasia": "ACME"},
+        {"solicitudId": 2, "razonSocial": "Solar del Norte S.A.", "nombreFantasia": None},
+    ]
+    records = transform_interesados(raw)
+    assert len(records) == 2
+    assert records[0].solicitud_id == 1
+    assert records[0].razon_social == "ACME SpA"
+    assert records[1].nombre_fantasia is None
+
+
+def test_transform_single_dict_is_wrapped():
+    records = transform_interesados({"solicitudId": 7, "razonSocial": "Eólica Sur Ltda."})
+    assert len(records) == 1
+    assert records[0].solicitud_id == 7
+
+
+def test_transform_json_payload():
+    payload = json.dumps([{"solicitudId": 3, "razonSocial": "X", "nombreFantasia": ""}])
+    records = transform_interesados(payload)
+    assert len(records) == 1
+    assert records[0].nombre_fantasia is None
+
+
+def test_transform_generator_input():
+    raw = ({"solicitudId": i, "razonSocial": f"Empresa {i}"} for i in range(3))
+    records = transform_interesados(raw)
+    assert [r.solicitud_id for r in records] == [0, 1, 2]
+
+
+def test_invalid_records_are_skipped():
+    raw = [
+        {"solicitudId": None, "razonSocial": "Sin ID"},
+        {"razonSocial": "Sin campo"},
+        {"solicitudId": "not-an-int", "razonSocial": "Tipo malo"},
+        {"solicitudId": 10, "razonSocial": "OK"},
+    ]
+    records = transform_interesados(raw)
+    assert [r.solicitud_id for r in records] == [10]
+
+
+def test_repeated_payload_is_memoized():
+    clear_payload_cache()
+    payload = json.dumps([{"solicitudId": 42, "razonSocial": "Repetida SpA"}])
+    first = transform_interesados(payload)
+    # Mutating the returned list must not leak into later cache hits.
+    first.append("sentinel")
+    second = transform_interesados(payload)
+    assert second == [Interesado(42, "Repetida SpA", None)]
+    clear_payload_cache()
+
+
+def test_transform_batch_mixed_payloads():
+    payloads = [
+        json.dumps({"solicitudId": 1, "razonSocial": "A"}),
+        b'{"solicitudId": 2, "razonSocial": "B"}',
+        "",
+        b"  ",
+        json.dumps([{"solicitudId": 3, "razonSocial": "C"}, {"solicitudId": 4, "razonSocial": "D"}]),
+        "[]",
+    ]
+    records = transform_interesados_batch(payloads)
+    assert [r.solicitud_id for r in records] == [1, 2, 3, 4]
+
+
+def test_transform_batch_empty():
+    assert transform_interesados_batch([]) == []
+    assert transform_interesados_batch(["", b"[]"]) == []
+
+
+def test_transform_parallel_matches_serial():
+    from energyintel.transform.interesados import _transform_chunk, _transform_parallel
+
+    raw = [{"solicitudId": i, "razonSocial": f"Empresa {i}"} for i in range(20)]
+    assert _transform_parallel(raw) == _transform_chunk(raw)
+
+
+def test_as_dict_round_trip():
+    record = Interesado(9, "ACME SpA", None)
+    assert record.as_dict() == {
+        "solicitud_id": 9,
+        "razon_social": "ACME SpA",
+        "nombre_fantasia": None,
+    }
+
+
+def test_validate_interesado_record():
+    assert validate_interesado_record({"solicitud_id": 5})
+    assert not validate_interesado_record({"solicitud_id": None})
+    assert not validate_interesado_record({})
+    assert not validate_interesado_record({"solicitud_id": "5"})
+
+
+def test_validate_edge_ids():
+    # isinstance semantics: a float id is rejected even when integral,
+    # and a bool (an int subclass) passes, matching the fallback path.
+    assert not validate_interesado_record({"solicitud_id": 5.0})
+    assert validate_interesado_record({"solicitud_id": True})
+
+
+def test_validate_paths_agree(monkeypatch):
+    from energyintel.transform import interesados
+
+    samples = [
+        {"solicitud_id": 5},
+        {"solicitud_id": 5.0},
+        {"solicitud_id": True},
+        {"solicitud_id": None},
+        {"solicitud_id": "5"},
+        {},
+    ]
+    compiled = [interesados.validate_interesado_record(s) for s in samples]
+    monkeypatch.setattr(interesados, "_compiled_validator", None)
+    fallback = [interesados.validate_interesado_record(s) for s in samples]
+    assert compiled == fallback
@@ -0,0 +1,295 @@
+import pytest
+
+from energyintel.parsers.pdf_fehaciente import FehacientePDFParser
+
+
+@pytest.fixture
+def parser(tmp_path):
+    parser = FehacientePDFParser()
+    parser.cache_dir = tmp_path / "cache"
+    return parser
+
+
+class TestNormalizeRut:
+    def test_plain_digits(self, parser):
+        assert parser._normalize_rut("765432101") == "76.543.210-1"
+
+    def test_already_dotted(self, parser):
+        assert parser._normalize_rut("76.543.210-1") == "76.543.210-1"
+
+    def test_dv_k_uppercased(self, parser):
+        assert parser._normalize_rut("9876543-k") == "9.876.543-K"
+
+    def test_garbage_returned_verbatim(self, parser):
+        assert parser._normalize_rut("N/A") == "N/A"
+        assert parser._normalize_rut("") == ""
+
+
+class TestParseDate:
+    def test_dash_format(self, parser):
+        assert parser._parse_date("15-03-2024") == "2024-03-15"
+
+    def test_slash_format(self, parser):
+        assert parser._parse_date("5/11/2023") == "2023-11-05"
+
+    def test_swapped_day_month(self, parser):
+        # Some templates emit MM-DD; a month > 12 means the fields are swapped.
+        assert parser._parse_date("03-25-2024") == "2024-03-25"
+
+    def test_invalid(self, parser):
+        assert parser._parse_date("31-02-2024") is None
+        assert parser._parse_date("sin fecha") is None
+        assert parser._parse_date(None) is None
+
+
+class TestParsePdfDate:
+    def test_full_timestamp(self, parser):
+        assert parser._parse_pdf_date("D:20240315104512-04'00'") == "2024-03-15 10:45:12"
+
+    def test_date_only(self, parser):
+        assert parser._parse_pdf_date("D:20240315") == "2024-03-15"
+
+    def test_invalid(self, parser):
+        assert parser._parse_pdf_date("garbage") is None
+        assert parser._parse_pdf_date(None) is None
+
+
+class TestParseDecimal:
+    def test_decimal_comma(self, parser):
+        assert parser._parse_decimal("2,5") == 2.5
+
+    def test_embedded_unit(self, parser):
+        assert parser._parse_decimal("9 MW") == 9.0
+
+    def test_numeric_passthrough(self, parser):
+        assert parser._parse_decimal(3) == 3.0
+
+    def test_no_number(self, parser):
+        assert parser._parse_decimal("N/A") is None
+        assert parser._parse_decimal(None) is None
+
+
+class TestParseCoordinate:
+    def test_thousand_separators(self, parser):
+        assert parser._parse_coordinate("345.678,5") == 345678.5
+
+    def test_plain(self, parser):
+        assert parser._parse_coordinate("6298765") == 6298765.0
+
+
+class TestParseTable:
+    def test_basic_fields(self, parser):
+        table = [
+            [None, "Razón Social", "Energía Austral SpA"],
+            [None, "RUT", "76.543.210-1"],
+            [None, "Giro", "Generación eléctrica"],
+            [None, "Nombre del Proyecto", "PMGD Solar Pampa"],
+            [None, "Potencia instalada [MW]", "8,9"],
+            [None, "Fecha estimada de conexión", "01-12-2025"],
+        ]
+        data = parser._parse_table(table)
+        assert data["razon_social"] == "Energía Austral SpA"
+        assert data["rut"] == "76.543.210-1"
+        assert data["giro"] == "Generación eléctrica"
+        assert data["nombre_proyecto"] == "PMGD Solar Pampa"
+        assert data["potencia_mw"] == 8.9
+        assert data["fecha_conexion_estimada"] == "2025-12-01"
+
+    def test_utm_coordinates(self, parser):
+        table = [
+            [None, "Coordenadas U.T.M.", "", "345.678", "Norte", "6.298.765", "Huso", "19"],
+        ]
+        data = parser._parse_table(table)
+        assert data["utm_este"] == 345678.0
+        assert data["utm_norte"] == 6298765.0
+        assert data["utm_huso"] == 19
+
+    def test_coordinator_contact_rows(self, parser):
+        table = [
+            [None, "E-mail", "empresa@example.cl"],
+            [None, "Nombre Coordinador", "Juana Pérez"],
+            [None, "E-mail", "jperez@example.cl"],
+            [None, "Teléfono", "+56 9 1234 5678"],
+        ]
+        data = parser._parse_table(table)
+        assert data["email"] == "empresa@example.cl"
+        assert data["coordinador_1_nombre"] == "Juana Pérez"
+        assert data["coordinador_1_email"] == "jperez@example.cl"
+        assert data["coordinador_1_telefono"] == "+56 9 1234 5678"
+
+    def test_empty_rows_ignored(self, parser):
+        assert parser._parse_table([[], [None], [None, "", ""]]) == {}
+
+    def test_coordinators_after_complete_fixed_block(self, parser):
+        # Coordinator rows come after every static field is already
+        # filled; the walk must not stop before reaching them.
+        table = [
+            [None, "Razón Social", "Energía Austral SpA"],
+            [None, "RUT", "76.543.210-1"],
+            [None, "RUT Representante", "12.345.678-5"],
+            [None, "Giro", "Generación eléctrica"],
+            [None, "Domicilio Legal", "Av. Costanera 200"],
+            [None, "Comuna", "Puerto Montt"],
+            [None, "Región", "Los Lagos"],
+            [None, "Nombre del Representante Legal", "Ana Rojas"],
+            [None, "E-mail", "empresa@example.cl"],
+            [None, "Teléfono", "+56 2 2345 6789"],
+            [None, "Nombre del Proyecto", "PMGD Solar Pampa"],
+            [None, "Tipo Tecnología", "Fotovoltaica"],
+            [None, "Potencia neta de inyección [MW]", "8,0"],
+            [None, "Potencia instalada [MW]", "8,9"],
+            [None, "Coordenadas U.T.M.", "", "345.678", "Norte", "6.298.765", "Huso", "19"],
+            [None, "Punto de Conexión", "Alimentador Pampa 23 kV"],
+            [None, "Subestación", "SE Pampa"],
+            [None, "Nivel de Tensión [kV]", "23"],
+            [None, "Fecha estimada de conexión", "01-12-2025"],
+            [None, "Fecha", "04-07-2023"],
+            [None, "Nombre Coordinador", "Juana Pérez"],
+            [None, "E-mail", "jperez@example.cl"],
+            [None, "Teléfono", "+56 9 1234 5678"],
+        ]
+        data = parser._parse_table(table)
+        assert data["fecha_presentacion"] == "2023-07-04"
+        assert data["coordinador_1_nombre"] == "Juana Pérez"
+        assert data["coordinador_1_email"] == "jperez@example.cl"
+        assert data["coordinador_1_telefono"] == "+56 9 1234 5678"
+
+
+class TestProgressiveExtractors:
+    def test_rut_strict(self, parser):
+        assert parser._extract_rut_progressive("RUT: 76.543.210-1") == "76.543.210-1"
+
+    def test_rut_no_dots(self, parser):
+        assert parser._extract_rut_progressive("rut 76543210-1 x") == "76.543.210-1"
+
+    def test_rut_ocr_artifacts(self, parser):
+        assert parser._extract_rut_progressive("76 543 210 - 1") == "76.543.210-1"
+
+    def test_rut_missing(self, parser):
+        assert parser._extract_rut_progressive("sin rol único tributario") is None
+
+    def test_razon_social_labelled(self, parser):
+        text = "Razón Social: Energía Austral SpA\nRUT: 76.543.210-1"
+        assert parser._extract_razon_social_progressive(text) == "Energía Austral SpA"
+
+    def test_razon_social_keyword(self, parser):
+        text = "presentado por Transmisora Del Valle S.A. con fecha"
+        assert "Transmisora Del Valle S.A." in parser._extract_razon_social_progressive(text)
+
+    def test_nombre_proyecto_labelled(self, parser):
+        text = "Nombre del Proyecto: PMGD Solar Pampa\nPotencia: 9 MW"
+        assert parser._extract_nombre_proyecto_progressive(text) == "PMGD Solar Pampa"
+
+    def test_nombre_proyecto_keyword(self, parser):
+        text = "la conexión de Planta Solar Los Andes al alimentador"
+        assert parser._extract_nombre_proyecto_progressive(text).startswith("Planta Solar Los Andes")
+
+    def test_razon_social_keyword_does_not_mask_label(self, parser):
+        # A keyword-shaped token before the label must not swallow it.
+        text = "Potencia: 9 MW\nrazon social EMPRESA UNO LTDA"
+        assert parser._extract_razon_social_progressive(text) == "EMPRESA UNO LTDA"
+
+    def test_nombre_proyecto_keyword_does_not_mask_label(self, parser):
+        text = "instalación Central Solar Vieja\nNombre del Proyecto: PMGD Pampa Norte\nPotencia: 9 MW"
+        assert parser._extract_nombre_proyecto_progressive(text) == "PMGD Pampa Norte"
+
+
+def test_parse_text_pdf_recovers_critical_fields(tmp_path, parser):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    path = tmp_path / "aviso.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Comunicación Fehaciente de Interconexión")
+    page.insert_text((72, 100), "Razón Social: Energía Austral SpA")
+    page.insert_text((72, 120), "RUT: 76.543.210-1")
+    page.insert_text((72, 140), "Nombre del Proyecto: PMGD Solar Pampa")
+    doc.save(str(path))
+    doc.close()
+
+    data = parser.parse(str(path))
+    assert data["rut"] == "76.543.210-1"
+    assert data["razon_social"] == "Energía Austral SpA"
+    assert data["nombre_proyecto"] == "PMGD Solar Pampa"
+
+
+def test_parse_cache_round_trip(tmp_path, parser):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    path = tmp_path / "aviso.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Comunicación Fehaciente de Interconexión")
+    page.insert_text((72, 100), "RUT: 76.543.210-1")
+    doc.save(str(path))
+    doc.close()
+
+    first = parser.parse(str(path))
+    assert list(parser.cache_dir.glob("*.json"))
+    assert parser.parse(str(path)) == first
+    assert parser.parse(str(path), force_refresh=True) == first
+
+
+def test_pypdf_fallback_runs_when_text_mining_finds_nothing(tmp_path, parser, monkeypatch):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    # Enough text to not look scanned, but nothing the progressive
+    # regexes can recover, so the pypdf re-extraction must be attempted.
+    path = tmp_path / "aviso.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Estimado señor, se adjunta el presente documento")
+    page.insert_text((72, 100), "para su revisión y archivo correspondiente.")
+    doc.save(str(path))
+    doc.close()
+
+    seen = {}
+
+    def fake_fallback(pdf_path, missing_fields=None):
+        seen["missing"] = set(missing_fields)
+        return {"rut": "76.543.210-1"}
+
+    monkeypatch.setattr(parser, "_parse_with_pypdf_fallback", fake_fallback)
+    data = parser.parse(str(path))
+    assert data["rut"] == "76.543.210-1"
+    assert "rut" in seen["missing"]
+
+
+def test_scanned_without_ocr_deps_is_not_cached(tmp_path, parser):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    from energyintel.parsers import pdf_fehaciente
+
+    if pdf_fehaciente.pdf2image is not None and pdf_fehaciente.pytesseract is not None:
+        pytest.skip("OCR stack installed; the bail-out path cannot run")
+    # A textless page routes through the scanned/OCR branch; without the
+    # OCR extra the metadata-only result must not be pinned in the cache.
+    path = tmp_path / "scanned.pdf"
+    doc = pymupdf.open()
+    doc.new_page()
+    doc.save(str(path))
+    doc.close()
+
+    data = parser.parse(str(path))
+    assert not data.get("rut")
+    assert not list(parser.cache_dir.glob("*.json"))
+
+
+def test_parse_many_preserves_order(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDFs with pymupdf")
+    from energyintel.parsers.pdf_fehaciente import parse_many
+
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"aviso_{i}.pdf"
+        doc = pymupdf.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), "Comunicación Fehaciente de Interconexión")
+        page.insert_text((72, 100), f"RUT: 76.543.21{i}-1")
+        doc.save(str(path))
+        doc.close()
+        paths.append(str(path))
+
+    results = list(parse_many(paths))
+    assert [r.get("rut") for r in results] == [f"76.543.21{i}-1" for i in range(3)]
+
+
+def test_parse_missing_file(parser):
+    with pytest.raises(FileNotFoundError):
+        parser.parse("/nonexistent/form.pdf")
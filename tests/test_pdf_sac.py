@@ -0,0 +1,215 @@
+import pytest
+
+from energyintel.parsers.pdf_sac import SACPDFParser, _try_import_ocr
+
+
+@pytest.fixture
+def parser(tmp_path):
+    parser = SACPDFParser()
+    parser.cache_dir = tmp_path / "cache"
+    return parser
+
+
+# A complete fixed block in the canonical SAC row order, as exported by
+# the digital form, with the open-ended coordinator rows trailing it.
+FULL_TABLE = [
+    [None, "Razón Social", "Solar del Norte S.A."],
+    [None, "RUT", "77.111.222-3"],
+    [None, "Giro", "Generación"],
+    [None, "Domicilio Legal", "Av. Balmaceda 100"],
+    [None, "Comuna", "Calama"],
+    [None, "Región", "Antofagasta"],
+    [None, "Nombre del Representante Legal", "Ana Rojas"],
+    [None, "E-mail", "arojas@example.cl"],
+    [None, "Teléfono", "+56 2 2345 6789"],
+    [None, "Nombre del Proyecto", "SAC PFV Oasis"],
+    [None, "Tipo Tecnología", "Fotovoltaica"],
+    [None, "Potencia Nominal [MW]", "3,0"],
+    [None, "Consumo Propio [kW]", "15"],
+    [None, "Coordenadas U.T.M. Este", "512.345", "", "Norte", "7.456.789"],
+    [None, "Punto de Conexión", "Alimentador Oasis 23 kV"],
+    [None, "Nivel de Tensión [kV]", "23"],
+    [None, "Fecha Estimada de Conexión", "15-08-2024"],
+    [None, "Fecha", "04-07-2023"],
+    [None, "Nombre Coordinador del Proyecto", "Pedro Soto"],
+    [None, "E-mail", "psoto@example.cl"],
+    [None, "Teléfono", "+56 9 8765 4321"],
+]
+
+
+class TestParseTable:
+    def test_basic_fields(self, parser):
+        table = [
+            [None, "Razón Social", "Solar del Norte S.A."],
+            [None, "RUT", "77.111.222-3"],
+            [None, "Giro", "Generación"],
+            [None, "Comuna", "Calama"],
+            [None, "Nombre del Proyecto", "SAC PFV Oasis"],
+            [None, "Potencia Nominal [MW]", "3,0"],
+            [None, "Nivel de Tensión [kV]", "23"],
+        ]
+        data = parser._parse_table(table)
+        assert data["razon_social"] == "Solar del Norte S.A."
+        assert data["rut"] == "77.111.222-3"
+        assert data["comuna"] == "Calama"
+        assert data["nombre_proyecto"] == "SAC PFV Oasis"
+        assert data["potencia_nominal_mw"] == 3.0
+        assert data["nivel_tension_kv"] == 23.0
+
+    def test_utm_row(self, parser):
+        table = [
+            [None, "Coordenadas U.T.M. Este", "512.345", "", "Norte", "7.456.789"],
+        ]
+        data = parser._parse_table(table)
+        assert data["utm_este"] == 512345.0
+        assert data["utm_norte"] == 7456789.0
+
+    def test_coordinator_rows(self, parser):
+        table = [
+            [None, "Nombre Coordinador del Proyecto", "Pedro Soto"],
+            [None, "E-mail", "psoto@example.cl"],
+        ]
+        data = parser._parse_table(table)
+        assert data["coordinador_proyecto_1_nombre"] == "Pedro Soto"
+        assert data["coordinador_proyecto_1_email"] == "psoto@example.cl"
+
+    def test_coordinators_after_complete_fixed_block(self, parser):
+        # Coordinator rows come after every static field is already
+        # filled; the walk must not stop before reaching them.
+        data = parser._parse_table(FULL_TABLE)
+        assert data["razon_social"] == "Solar del Norte S.A."
+        assert data["fecha_presentacion"] == "2023-07-04"
+        assert data["coordinador_proyecto_1_nombre"] == "Pedro Soto"
+        assert data["coordinador_proyecto_1_email"] == "psoto@example.cl"
+        assert data["coordinador_proyecto_1_telefono"] == "+56 9 8765 4321"
+
+    def test_canonical_layout_keeps_trailing_coordinators(self, parser):
+        # A digital producer routes through the fixed-position layout;
+        # rows past the fixed block must still reach the generic walk.
+        data = parser._parse_table(FULL_TABLE, producer="Microsoft® Excel® 2016")
+        assert data["razon_social"] == "Solar del Norte S.A."
+        assert data["rut"] == "77.111.222-3"
+        assert data["potencia_nominal_mw"] == 3.0
+        assert data["utm_este"] == 512345.0
+        assert data["utm_norte"] == 7456789.0
+        assert data["fecha_conexion_estimada"] == "2024-08-15"
+        assert data["coordinador_proyecto_1_nombre"] == "Pedro Soto"
+        assert data["coordinador_proyecto_1_email"] == "psoto@example.cl"
+        assert data["coordinador_proyecto_1_telefono"] == "+56 9 8765 4321"
+
+
+class TestHelpers:
+    def test_normalize_rut(self, parser):
+        assert parser._normalize_rut("771112223") == "77.111.222-3"
+        assert parser._normalize_rut("77.111.222-3") == "77.111.222-3"
+
+    def test_parse_date(self, parser):
+        assert parser._parse_date("02-07-2024") == "2024-07-02"
+        assert parser._parse_date("02/07/2024") == "2024-07-02"
+        assert parser._parse_date("sin fecha") is None
+
+    def test_parse_pdf_date(self, parser):
+        assert parser._parse_pdf_date("D:20230704120000") == "2023-07-04 12:00:00"
+
+    def test_parse_decimal(self, parser):
+        assert parser._parse_decimal("1,25") == 1.25
+        assert parser._parse_decimal("abc") is None
+
+    def test_rut_progressive(self, parser):
+        assert parser._extract_rut_progressive("RUT: 77.111.222-3") == "77.111.222-3"
+
+    def test_razon_social_keyword_does_not_mask_label(self, parser):
+        # A keyword-shaped token before the label must not swallow it.
+        text = "Potencia: 9 MW\nrazon social EMPRESA UNO LTDA"
+        assert parser._extract_razon_social_progressive(text) == "EMPRESA UNO LTDA"
+
+    def test_nombre_proyecto_keyword_does_not_mask_label(self, parser):
+        text = "instalación Central Solar Vieja\nNombre del Proyecto: PMGD Pampa Norte\nPotencia: 9 MW"
+        assert parser._extract_nombre_proyecto_progressive(text) == "PMGD Pampa Norte"
+
+
+def test_parse_text_pdf_recovers_critical_fields(tmp_path, parser):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    path = tmp_path / "sac.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Solicitud de Autorización de Conexión (SAC)")
+    page.insert_text((72, 100), "Razón Social: Eléctrica Del Norte SpA")
+    page.insert_text((72, 120), "RUT: 77.111.222-3")
+    page.insert_text((72, 140), "Nombre del Proyecto: PMGD Solar Pampa")
+    doc.save(str(path))
+    doc.close()
+
+    data = parser.parse(str(path))
+    assert data["rut"] == "77.111.222-3"
+    assert data["razon_social"] == "Eléctrica Del Norte SpA"
+    assert data["nombre_proyecto"] == "PMGD Solar Pampa"
+
+
+def test_parse_cache_round_trip(tmp_path, parser):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    path = tmp_path / "sac.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Solicitud de Autorización de Conexión (SAC)")
+    page.insert_text((72, 100), "RUT: 77.111.222-3")
+    doc.save(str(path))
+    doc.close()
+
+    first = parser.parse(str(path))
+    assert list(parser.cache_dir.glob("*.json"))
+    assert parser.parse(str(path)) == first
+    assert parser.parse(str(path), force_refresh=True) == first
+
+
+def test_scanned_without_ocr_deps_is_not_cached(tmp_path, parser):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    if _try_import_ocr() is not None:
+        pytest.skip("OCR stack installed; the bail-out path cannot run")
+    # A textless page routes through the scanned/OCR branch; without the
+    # OCR extra the empty result must not be pinned in the cache.
+    path = tmp_path / "scanned.pdf"
+    doc = pymupdf.open()
+    doc.new_page()
+    doc.save(str(path))
+    doc.close()
+
+    assert parser.parse(str(path)) == {}
+    assert not list(parser.cache_dir.glob("*.json"))
+
+
+def test_parse_many_preserves_order(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDFs with pymupdf")
+
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"sac_{i}.pdf"
+        doc = pymupdf.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), "Solicitud de Autorización de Conexión (SAC)")
+        page.insert_text((72, 100), f"RUT: 77.111.22{i}-3")
+        doc.save(str(path))
+        doc.close()
+        paths.append(str(path))
+
+    results = SACPDFParser.parse_many(paths)
+    assert [r.get("rut") for r in results] == [f"77.111.22{i}-3" for i in range(3)]
+
+
+def test_parse_metadata_only(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf", reason="test builds its PDF with pymupdf")
+    path = tmp_path / "sac.pdf"
+    doc = pymupdf.open()
+    doc.new_page()
+    doc.set_metadata({"producer": "Microsoft® Excel® 2016", "creationDate": "D:20230704120000"})
+    doc.save(str(path))
+    doc.close()
+
+    data = SACPDFParser.parse_metadata_only(str(path))
+    assert data["pdf_producer"].startswith("Microsoft")
+    assert data["pdf_creation_date"] == "2023-07-04 12:00:00"
+
+
+def test_parse_missing_file(parser):
+    with pytest.raises(FileNotFoundError):
+        parser.parse("/nonexistent/sac.pdf")
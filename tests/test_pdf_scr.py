@@ -0,0 +1,52 @@
+import pytest
+
+from energyintel.parsers.pdf_scr import SCRPDFParser
+
+
+@pytest.fixture
+def parser():
+    return SCRPDFParser()
+
+
+def test_parse_table_labels_anywhere(parser):
+    table = [
+        ["Razón Social", None, "Hidro Maule Ltda."],
+        [None, "RUT", None, "76.999.888-7"],
+        ["Nombre del Proyecto", "Minicentral El Salto"],
+        ["Potencia (MW)", "2,8"],
+    ]
+    data = parser._parse_table(table)
+    assert data["razon_social"] == "Hidro Maule Ltda."
+    assert data["rut"] == "76.999.888-7"
+    assert data["nombre_proyecto"] == "Minicentral El Salto"
+    assert data["potencia_mw"] == 2.8
+
+
+def test_email_requires_coordinator_name(parser):
+    no_name = parser._parse_table([["E-mail", "x@example.cl"]])
+    assert "coordinador_email" not in no_name
+
+    with_name = parser._parse_table(
+        [
+            ["Coordinador del Proyecto", "Ana Rojas"],
+            ["E-mail", "arojas@example.cl"],
+        ]
+    )
+    assert with_name["coordinador_nombre"] == "Ana Rojas"
+    assert with_name["coordinador_email"] == "arojas@example.cl"
+
+
+def test_first_hit_wins(parser):
+    table = [
+        ["Comuna", "Til Til"],
+        ["Comuna", "Otra"],
+    ]
+    assert parser._parse_table(table)["comuna"] == "Til Til"
+
+
+def test_find_helpers(parser):
+    row = [None, "Razón Social", "", "ACME SpA"]
+    idx = parser._find_label_idx(row, ("razon social", "razón social"))
+    assert idx == 1
+    assert parser._find_value_in_row(row, idx) == "ACME SpA"
+    assert parser._find_label_idx(row, ("rut",)) is None